@@ -0,0 +1,91 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import exceptions, status
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.courses.serializers import CourseSerializer, LectureSerializer, HomeworkSerializer
+from apps.users.authentication import StatelessJWTAuthentication
+
+
+# Async list/retrieve endpoints for ASGI deployments: rows are fetched with the async ORM
+# and the response is written without holding a worker thread, so slow clients only cost
+# a coroutine. Lists use keyset pagination (?after=<id>&limit=<n>) on the primary key.
+class AsyncReadView(View):
+    http_method_names = ['get']
+    queryset = None
+    serializer_class = None
+    descending = False
+
+    async def get_queryset(self, user):
+        # As in GenericAPIView: re-evaluate the class-level queryset on every request.
+        return self.queryset.all()
+
+    async def get(self, request, pk=None):
+        try:
+            user = await self.authenticate(request)
+            queryset = await self.get_queryset(user)
+            if pk is None:
+                return await self.list(request, queryset)
+            return await self.retrieve(request, queryset, pk)
+        except exceptions.APIException as exc:
+            return JsonResponse({'detail': exc.detail}, status=exc.status_code)
+
+    @staticmethod
+    async def authenticate(request):
+        result = await sync_to_async(StatelessJWTAuthentication().authenticate)(request)
+        if result is None:
+            raise exceptions.NotAuthenticated()
+        return result[0]
+
+    async def retrieve(self, request, queryset, pk):
+        instance = await queryset.filter(pk=pk).afirst()
+        if instance is None:
+            raise exceptions.NotFound()
+        return JsonResponse(await self.serialize(request, instance))
+
+    async def list(self, request, queryset):
+        try:
+            limit = int(request.GET.get('limit', settings.API_PAGE_SIZE))
+            after = request.GET.get('after')
+            if after is not None:
+                after = int(after)
+        except ValueError:
+            raise exceptions.ValidationError("'after' and 'limit' must be integers.")
+        limit = min(max(limit, 1), settings.API_MAX_PAGE_SIZE)
+
+        queryset = queryset.order_by('-pk' if self.descending else 'pk')
+        if after is not None:
+            queryset = queryset.filter(**{'pk__lt' if self.descending else 'pk__gt': after})
+        instances = [instance async for instance in queryset[:limit + 1]]
+
+        next_url = None
+        if len(instances) > limit:
+            instances = instances[:limit]
+            query = request.GET.copy()
+            query['after'] = instances[-1].pk
+            next_url = request.build_absolute_uri(f'{request.path}?{query.urlencode()}')
+
+        results = await self.serialize(request, instances, many=True)
+        return JsonResponse({'next': next_url, 'results': results}, status=status.HTTP_200_OK)
+
+    async def serialize(self, request, instance, many=False):
+        # Serializers read and fill the content cache, which may be a network round trip.
+        serializer = self.serializer_class(instance, many=many, context={'request': request})
+        return await sync_to_async(lambda: serializer.data)()
+
+
+class CourseAsyncView(AsyncReadView):
+    queryset = Course.objects.with_teacher().with_student_count()
+    serializer_class = CourseSerializer
+
+
+class LectureAsyncView(AsyncReadView):
+    queryset = Lecture.objects.all()
+    serializer_class = LectureSerializer
+
+
+class HomeworkAsyncView(AsyncReadView):
+    queryset = Homework.objects.all()
+    serializer_class = HomeworkSerializer
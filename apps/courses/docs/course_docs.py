@@ -42,3 +42,65 @@ add_teacher_docs = extend_schema(
         OpenApiParameter("teacher_id", type=int, required=True, location=OpenApiParameter.QUERY),
     ],
 )
+
+course_gradebook_docs = extend_schema(
+    tags=["Courses"],
+    summary="Course gradebook",
+    description=(
+        "Student x homework matrix of best grades with averages, medians and "
+        "completion rates per student, per homework and for the whole course."
+    ),
+)
+
+course_stats_docs = extend_schema(
+    tags=["Courses"],
+    summary="Course dashboard statistics",
+)
+
+course_students_docs = extend_schema(
+    tags=["Courses"],
+    summary="List students enrolled in a course",
+)
+
+add_students_docs = extend_schema(
+    tags=["Courses"],
+    summary="Enroll many students in a course",
+    description="Accepts a JSON list `student_ids` or a CSV `file` with one student id per row.",
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {"student_ids": {"type": "array", "items": {"type": "integer"}}},
+            "required": ["student_ids"],
+        },
+        "multipart/form-data": {
+            "type": "object",
+            "properties": {"file": {"type": "string", "format": "binary"}},
+            "required": ["file"],
+        },
+    },
+)
+
+remove_students_docs = extend_schema(
+    tags=["Courses"],
+    summary="Remove many students from a course",
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {"student_ids": {"type": "array", "items": {"type": "integer"}}},
+            "required": ["student_ids"],
+        }
+    },
+)
+
+course_clone_docs = extend_schema(
+    tags=["Courses"],
+    summary="Copy a course with its teachers, lectures and homework",
+    description="Students, submissions and grades are not copied. Presentations are shared with the original.",
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {"title": {"type": "string"}},
+        },
+    },
+    responses={status.HTTP_201_CREATED: OpenApiResponse(description="Course copy created")},
+)
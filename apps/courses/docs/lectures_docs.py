@@ -16,3 +16,55 @@ lecture_destroy_docs = extend_schema(
     tags=["Lectures"],
     summary="Delete lecture",
 )
+
+presentation_upload_docs = extend_schema(
+    tags=["Lectures"],
+    summary="Start a resumable presentation upload",
+    description="Declares the file name, size in bytes and SHA-256 hex digest. "
+                "Chunks are then sent with PATCH to the returned upload id.",
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "size": {"type": "integer"},
+                "sha256": {"type": "string"},
+            },
+            "required": ["filename", "size", "sha256"],
+        },
+    },
+    responses={status.HTTP_201_CREATED: OpenApiResponse(description="Upload started")},
+)
+
+presentation_upload_chunk_docs = extend_schema(
+    tags=["Lectures"],
+    summary="Get upload progress (GET) or append a chunk (PATCH)",
+    description="PATCH sends raw bytes (application/offset+octet-stream) with an `Upload-Offset` header equal "
+                "to the current offset. A mismatched offset returns 409 with the offset to resume from.",
+    request={"application/offset+octet-stream": {"type": "string", "format": "binary"}},
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(description="Current upload offset"),
+        status.HTTP_409_CONFLICT: OpenApiResponse(description="Offset mismatch"),
+    },
+)
+
+presentation_upload_complete_docs = extend_schema(
+    tags=["Lectures"],
+    summary="Finish an upload and attach it to the lecture",
+    request=None,
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(description="Presentation attached"),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(description="Upload incomplete or checksum mismatch"),
+    },
+)
+
+lecture_presentation_docs = extend_schema(
+    tags=["Lectures"],
+    summary="Download the lecture presentation",
+    description="Available to the course's teachers and students. Supports single `Range` requests.",
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(description="Presentation file"),
+        status.HTTP_206_PARTIAL_CONTENT: OpenApiResponse(description="Requested byte range"),
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: OpenApiResponse(description="Range outside the file"),
+    },
+)
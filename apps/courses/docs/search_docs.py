@@ -0,0 +1,13 @@
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+search_docs = extend_schema(
+    tags=["Search"],
+    summary="Full-text search over lectures, homework and submissions",
+    description="Results are limited to what the user can see and ordered by relevance.",
+    parameters=[
+        OpenApiParameter("q", str, required=True, description="Search text (web search syntax: quotes, OR, -)."),
+        OpenApiParameter(
+            "type", str, description="Comma-separated subset of lecture, homework, submission. Default: all."
+        ),
+    ],
+)
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.courses.models import Lecture
+from apps.courses.services.presentation_service import PresentationUploadService
+from apps.courses.storage import ContentAddressedStorage
+
+
+class Command(BaseCommand):
+    help = "Delete content-addressed presentation blobs that no Lecture references and abandoned uploads."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Only report what would be deleted.")
+        parser.add_argument(
+            '--grace', type=int, default=3600,
+            help="Keep blobs and uploads modified within this many seconds; a save or chunk may still be in flight.",
+        )
+
+    def handle(self, *args, **options):
+        field = Lecture._meta.get_field('presentation')
+        storage = field.storage
+        root = field.upload_to.rstrip('/')
+        cutoff = timezone.now() - timedelta(seconds=options['grace'])
+        referenced = set(Lecture.objects.exclude(presentation='').values_list('presentation', flat=True))
+
+        deleted = freed = 0
+        if storage.exists(root):
+            for directory in storage.listdir(root)[0]:
+                for filename in storage.listdir(f'{root}/{directory}')[1]:
+                    name = f'{root}/{directory}/{filename}'
+                    if not ContentAddressedStorage.digest_from_name(name) or name in referenced:
+                        continue
+                    if storage.get_modified_time(name) > cutoff:
+                        continue
+                    freed += storage.size(name)
+                    deleted += 1
+                    if not options['dry_run']:
+                        storage.delete(name)
+
+        uploads, upload_bytes = PresentationUploadService.expire(cutoff, dry_run=options['dry_run'])
+
+        verb = "Would delete" if options['dry_run'] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {deleted} unreferenced blobs ({freed} bytes) "
+            f"and {uploads} abandoned uploads ({upload_bytes} bytes)."
+        ))
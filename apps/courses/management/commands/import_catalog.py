@@ -0,0 +1,156 @@
+import csv
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.courses.services.search_service import SearchService
+from apps.courses.services.stats_service import CourseStatsService
+from apps.users.models import User
+from apps.users.services.password_service import PasswordService
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import users and a course catalog (courses, lectures, homeworks) from CSV or JSON. "
+        "Users: CSV with username,email,password,role columns or a JSON list of such objects. "
+        "Courses: a JSON list of {title, description, teachers, students, lectures: [{topic, homeworks}]} "
+        "or a CSV with course,description,lecture,homework columns (one row per homework). "
+        "The CSV catalog cannot assign teachers or students; use JSON for that."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=Path, help="Users file (.csv or .json).")
+        parser.add_argument('--courses', type=Path, help="Course catalog file (.csv or .json).")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--workers', type=int, default=None, help="Password hashing processes.")
+
+    def handle(self, *args, **options):
+        if not options['users'] and not options['courses']:
+            raise CommandError("Pass --users and/or --courses.")
+        self.batch_size = options['batch_size']
+
+        with transaction.atomic():
+            if options['users']:
+                self.import_users(self.read_users(Path(options['users'])), options['workers'])
+            if options['courses']:
+                self.import_courses(self.read_courses(Path(options['courses'])))
+
+    def read_rows(self, path):
+        with path.open(encoding='utf-8-sig') as file:
+            if path.suffix == '.json':
+                return json.load(file)
+            if path.suffix == '.csv':
+                return list(csv.DictReader(file))
+        raise CommandError(f"Unsupported file type: {path}")
+
+    def require_columns(self, rows, columns, path):
+        for number, row in enumerate(rows, start=1):
+            missing = [column for column in columns if not row.get(column)]
+            if missing:
+                raise CommandError(f"{path}: row {number} is missing required column {', '.join(missing)}.")
+
+    def read_users(self, path):
+        rows = self.read_rows(path)
+        self.require_columns(rows, ('username',), path)
+        return rows
+
+    def read_courses(self, path):
+        rows = self.read_rows(path)
+        if path.suffix == '.json':
+            return rows
+
+        self.require_columns(rows, ('course', 'lecture'), path)
+
+        courses = {}
+        for row in rows:
+            course = courses.setdefault(row['course'], {
+                'title': row['course'],
+                'description': row.get('description', ''),
+                'lectures': {},
+            })
+            lecture = course['lectures'].setdefault(row['lecture'], {'topic': row['lecture'], 'homeworks': []})
+            if row.get('homework'):
+                lecture['homeworks'].append(row['homework'])
+        for course in courses.values():
+            course['lectures'] = list(course['lectures'].values())
+        return list(courses.values())
+
+    def import_users(self, rows, workers):
+        started = time.monotonic()
+        existing = set(
+            User.objects.filter(username__in=[row['username'] for row in rows]).values_list('username', flat=True)
+        )
+        new_rows = []
+        for row in rows:
+            if row['username'] in existing:
+                continue
+            if row.get('role') not in (User.Role.STUDENT, User.Role.TEACHER):
+                raise CommandError(f"Invalid role for {row['username']!r}: must be 'student' or 'teacher'.")
+            existing.add(row['username'])
+            new_rows.append(row)
+
+        passwords = PasswordService.hash_many([row.get('password') or None for row in new_rows], workers)
+        users = [
+            User(username=row['username'], email=row.get('email') or '', role=row['role'], password=password)
+            for row, password in zip(new_rows, passwords)
+        ]
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        self.report("users", len(users), started, skipped=len(rows) - len(users))
+
+    def import_courses(self, catalog):
+        started = time.monotonic()
+        courses = Course.objects.bulk_create(
+            [Course(title=item['title'], description=item.get('description', '')) for item in catalog],
+            batch_size=self.batch_size,
+        )
+
+        usernames = {name for item in catalog for name in item.get('teachers', []) + item.get('students', [])}
+        user_ids = dict(User.objects.filter(username__in=usernames).values_list('username', 'id'))
+        missing = usernames - user_ids.keys()
+        if missing:
+            raise CommandError(f"Unknown users in catalog: {', '.join(sorted(missing))}")
+
+        members = defaultdict(list)
+        lectures, lecture_homeworks = [], []
+        for course, item in zip(courses, catalog):
+            for field in ('teachers', 'students'):
+                through = getattr(Course, field).through
+                members[through].extend(
+                    through(course_id=course.pk, user_id=user_ids[name]) for name in item.get(field, [])
+                )
+            for lecture_item in item.get('lectures', []):
+                lectures.append(Lecture(course=course, topic=lecture_item['topic']))
+                lecture_homeworks.append(lecture_item.get('homeworks', []))
+
+        for through, rows in members.items():
+            through.objects.bulk_create(rows, batch_size=self.batch_size, ignore_conflicts=True)
+        Lecture.objects.bulk_create(lectures, batch_size=self.batch_size)
+        homeworks = Homework.objects.bulk_create(
+            [
+                Homework(lecture=lecture, text=text)
+                for lecture, texts in zip(lectures, lecture_homeworks)
+                for text in texts
+            ],
+            batch_size=self.batch_size,
+        )
+
+        # bulk_create skips save() and the signals that maintain search vectors and CourseStats.
+        if courses:
+            course_ids = [course.pk for course in courses]
+            SearchService.refresh(Lecture.objects.filter(course_id__in=course_ids))
+            SearchService.refresh(Homework.objects.filter(lecture__course_id__in=course_ids))
+            CourseStatsService.rebuild(*course_ids)
+        self.report("courses", len(courses), started)
+        self.stdout.write(f"  with {len(lectures)} lectures and {len(homeworks)} homeworks")
+
+    def report(self, label, count, started, skipped=0):
+        elapsed = max(time.monotonic() - started, 1e-6)
+        message = f"Imported {count} {label} in {elapsed:.2f}s ({count / elapsed:.0f}/s)"
+        if skipped:
+            message += f", skipped {skipped} existing"
+        self.stdout.write(self.style.SUCCESS(message))
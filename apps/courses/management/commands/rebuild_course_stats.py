@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.courses.services.stats_service import CourseStatsService
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized CourseStats rows from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_ids', nargs='*', type=int, help="Limit the rebuild to these courses.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuilt = CourseStatsService.rebuild(*options['course_ids'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt statistics for {rebuilt} courses."))
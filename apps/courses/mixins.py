@@ -0,0 +1,70 @@
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from apps.courses.services.cache_service import ContentCacheService
+
+
+class ConditionalGetMixin:
+    # Validators come from updated_at, so a matching If-None-Match / If-Modified-Since
+    # costs one indexed lookup and skips serialization entirely.
+    def retrieve(self, request, *args, **kwargs):
+        model = self.get_serializer_class().Meta.model
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        try:
+            updated_at = model._default_manager.filter(
+                **{self.lookup_field: lookup}
+            ).values_list('updated_at', flat=True).first()
+        except (TypeError, ValueError, ValidationError):
+            # A malformed lookup: let get_object_or_404 answer it as usual.
+            updated_at = None
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        etag = quote_etag(f'{model._meta.label_lower}-{lookup}-{updated_at.timestamp():.6f}')
+        return self._conditional_response(request, etag, updated_at, super().retrieve, *args, **kwargs)
+
+    # Override when the list queryset carries joins or annotations the aggregate does not need.
+    def get_validator_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        state = self.get_validator_queryset().order_by().aggregate(
+            last_modified=Max('updated_at'), total=Count('pk')
+        )
+        if state['last_modified'] is None:
+            return super().list(request, *args, **kwargs)
+
+        digest = hashlib.md5(
+            f"{state['total']}-{state['last_modified'].timestamp():.6f}-{request.GET.urlencode()}".encode()
+        ).hexdigest()
+        return self._conditional_response(
+            request, quote_etag(digest), state['last_modified'], super().list, *args, **kwargs
+        )
+
+    def _conditional_response(self, request, etag, updated_at, render, *args, **kwargs):
+        last_modified = int(updated_at.timestamp())
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = render(request, *args, **kwargs)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class CachedRetrieveMixin:
+    # Only for viewsets whose queryset is not scoped to the requesting user:
+    # a cache hit is served without touching the database.
+    def retrieve(self, request, *args, **kwargs):
+        model = self.get_serializer_class().Meta.model
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        payload = ContentCacheService.get_payload(model, lookup, ContentCacheService.variant_for(request))
+        if payload is not None:
+            return Response(payload)
+        return super().retrieve(request, *args, **kwargs)
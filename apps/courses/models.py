@@ -1,25 +1,62 @@
+import uuid
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Count, Prefetch, QuerySet, Value
+from django.utils import timezone
 
+from apps.courses.storage import ContentAddressedStorage, presentation_storage
 from apps.users.models import User
 
 
+SERIALIZED_USER_FIELDS = ('id', 'username', 'email', 'role')
+
+
+def search_vector(expression):
+    return SearchVector(expression, config=settings.SEARCH_CONFIG)
+
+
+# search_vector is computed in save() from SEARCH_FIELD; bulk writes refresh it with
+# SearchService.refresh().
+class SearchableMixin:
+    SEARCH_FIELD = None
+
+    def set_search_vector(self, kwargs):
+        self.search_vector = search_vector(Value(getattr(self, self.SEARCH_FIELD) or ''))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.SEARCH_FIELD in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'search_vector'}
+
+
 class CourseQuerySet(QuerySet):
     def for_user(self, user):
         if user.is_superuser:
             return self.all()
+        from apps.courses.services.access_service import CourseAccessService
+
+        access = CourseAccessService.get_access(user)
         if user.role == user.Role.STUDENT:
-            return self.filter(students=user)
+            return self.filter(id__in=access.enrolled)
         if user.role == user.Role.TEACHER:
-            return self.filter(teachers=user)
+            return self.filter(id__in=access.teaching)
         return self.none()
 
     def with_teacher(self):
-        return self.prefetch_related('teachers')
+        return self.prefetch_related(
+            Prefetch('teachers', queryset=User.objects.only(*SERIALIZED_USER_FIELDS))
+        )
+
+    def with_student_count(self):
+        return self.annotate(student_count=Count('students'))
 
     def available(self):
         return self.filter(is_active=True)
 
+    def touch(self):
+        return self.update(updated_at=timezone.now())
+
 
 class CourseManager(models.Manager):
     def get_queryset(self):
@@ -31,6 +68,9 @@ class CourseManager(models.Manager):
     def with_teacher(self):
         return self.get_queryset().with_teacher()
 
+    def with_student_count(self):
+        return self.get_queryset().with_student_count()
+
     def available(self):
         return self.get_queryset().available()
 
@@ -41,6 +81,7 @@ class Course(models.Model):
 
     teachers = models.ManyToManyField('users.User', related_name='teaching_courses')
     students = models.ManyToManyField('users.User', related_name='enrolled_courses')
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = CourseManager()
 
@@ -52,20 +93,42 @@ class LectureQuerySet(models.QuerySet):
     def for_user(self, user):
         if user.is_superuser:
             return self.all()
+        from apps.courses.services.access_service import CourseAccessService
+
+        access = CourseAccessService.get_access(user)
         if user.role == user.Role.STUDENT:
-            return self.filter(course__students=user)
+            return self.filter(course_id__in=access.enrolled)
         if user.role == user.Role.TEACHER:
-            return self.filter(course__teachers=user)
+            return self.filter(course_id__in=access.teaching)
         return self.none()
 
 
-class Lecture(models.Model):
+class Lecture(SearchableMixin, models.Model):
+    SEARCH_FIELD = 'topic'
+
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='lectures')
     topic = models.CharField(max_length=255)
-    presentation = models.FileField(upload_to='presentations/', blank=True, null=True)
+    presentation = models.FileField(upload_to='presentations/', storage=presentation_storage, blank=True, null=True)
+    presentation_sha256 = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = LectureQuerySet.as_manager()
 
+    class Meta:
+        indexes = [GinIndex(fields=['search_vector'], name='lecture_search_idx')]
+
+    def save(self, *args, **kwargs):
+        # Commit a new file first: its stored (content-addressed) name carries the digest.
+        if self.presentation and not self.presentation._committed:
+            self.presentation.save(self.presentation.name, self.presentation.file, save=False)
+        self.presentation_sha256 = ContentAddressedStorage.digest_from_name(self.presentation.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'presentation' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'presentation_sha256'}
+        self.set_search_vector(kwargs)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f'{self.course.title}: {self.topic}'
 
@@ -74,18 +137,63 @@ class HomeworkQuerySet(models.QuerySet):
     def for_user(self, user):
         if user.is_superuser:
             return self.all()
+        from apps.courses.services.access_service import CourseAccessService
+
+        access = CourseAccessService.get_access(user)
         if user.role == user.Role.STUDENT:
-            return self.filter(lecture__course__students=user)
+            return self.filter(lecture__course_id__in=access.enrolled)
         if user.role == user.Role.TEACHER:
-            return self.filter(lecture__course__teachers=user)
+            return self.filter(lecture__course_id__in=access.teaching)
         return self.none()
 
 
-class Homework(models.Model):
+class Homework(SearchableMixin, models.Model):
+    SEARCH_FIELD = 'text'
+
     lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name='homeworks')
     text = models.TextField()
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = HomeworkQuerySet.as_manager()
 
+    class Meta:
+        indexes = [GinIndex(fields=['search_vector'], name='homework_search_idx')]
+
+    def save(self, *args, **kwargs):
+        self.set_search_vector(kwargs)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f'Homework for {self.lecture.topic}'
+
+
+class CourseStats(models.Model):
+    course = models.OneToOneField(Course, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    lecture_count = models.IntegerField(default=0)
+    homework_count = models.IntegerField(default=0)
+    submission_count = models.IntegerField(default=0)
+    ungraded_submission_count = models.IntegerField(default=0)
+    grade_count = models.IntegerField(default=0)
+    grade_total = models.BigIntegerField(default=0)
+
+    @property
+    def average_grade(self):
+        return round(self.grade_total / self.grade_count, 2) if self.grade_count else None
+
+    def __str__(self):
+        return f'Stats for course {self.course_id}'
+
+
+class PresentationUpload(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name='presentation_uploads')
+    created_by = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='presentation_uploads')
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0)
+    sha256 = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'Upload of {self.filename} ({self.offset}/{self.size})'
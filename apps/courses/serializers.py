@@ -1,30 +1,98 @@
+from django.urls import reverse
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
-from apps.courses.models import Course, Lecture, Homework
+from apps.courses.models import Course, CourseStats, Lecture, Homework
+from apps.courses.services.cache_service import ContentCacheService
 from apps.users.serializers import UserSerializer
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CachedListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        instances = list(data.all() if hasattr(data, 'all') else data)
+        return ContentCacheService.get_or_render(
+            self.child.Meta.model, instances, self.child.render, self.child.cache_variant()
+        )
+
+
+class CachedSerializerMixin:
+    def render(self, instance):
+        return super().to_representation(instance)
+
+    def cache_variant(self):
+        return ContentCacheService.variant_for(self.context.get('request'))
+
+    def to_representation(self, instance):
+        return ContentCacheService.get_or_render(
+            self.Meta.model, [instance], self.render, self.cache_variant()
+        )[0]
+
+
+class CourseSerializer(CachedSerializerMixin, serializers.ModelSerializer):
     teachers = UserSerializer(many=True, read_only=True)
-    students = UserSerializer(many=True, read_only=True)
+    # Filled by Course.objects.with_student_count(); views serialize annotated instances only.
+    student_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Course
-        fields = ['id', 'title', 'description', 'teachers', 'students']
+        fields = ['id', 'title', 'description', 'teachers', 'student_count']
+        list_serializer_class = CachedListSerializer
+
+
+class PresentationField(serializers.FileField):
+    # Points clients at the access-checked download action instead of the raw MEDIA_URL.
+    def to_representation(self, value):
+        if not value:
+            return None
+        url = reverse('lectures-presentation', args=[value.instance.pk])
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
 
 
-class LectureSerializer(serializers.ModelSerializer):
+class LectureSerializer(CachedSerializerMixin, serializers.ModelSerializer):
     course = serializers.PrimaryKeyRelatedField(queryset=Course.objects.all())
+    presentation = PresentationField(required=False, allow_null=True)
 
     class Meta:
         model = Lecture
         fields = ['id', 'course', 'topic', 'presentation']
+        list_serializer_class = CachedListSerializer
 
+    # Submissions, grades and comments store the course of their lecture; moving it would orphan them.
+    def validate_course(self, value):
+        if self.instance is not None and value.pk != self.instance.course_id:
+            raise serializers.ValidationError('A lecture cannot be moved to another course')
+        return value
 
-class HomeworkSerializer(serializers.ModelSerializer):
+
+class HomeworkSerializer(CachedSerializerMixin, serializers.ModelSerializer):
     lecture = serializers.PrimaryKeyRelatedField(queryset=Lecture.objects.all())
 
     class Meta:
         model = Homework
         fields = ['id', 'lecture', 'text']
+        list_serializer_class = CachedListSerializer
+
+    def validate_lecture(self, value):
+        if self.instance is not None and value.pk != self.instance.lecture_id:
+            raise serializers.ValidationError('A homework cannot be moved to another lecture')
+        return value
+
+
+class CourseStatsSerializer(serializers.ModelSerializer):
+    average_grade = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = CourseStats
+        fields = [
+            'course', 'lecture_count', 'homework_count', 'submission_count',
+            'ungraded_submission_count', 'grade_count', 'average_grade',
+        ]
+
+
+class SearchResultSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    object_id = serializers.IntegerField()
+    course = serializers.IntegerField(source='course_pk')
+    snippet = serializers.CharField()
+    rank = serializers.FloatField()
@@ -0,0 +1,50 @@
+from typing import NamedTuple
+
+from django.db.models import Value
+
+from apps.courses.models import Course
+from apps.users.models import User
+
+
+class CourseAccess(NamedTuple):
+    teaching: frozenset
+    enrolled: frozenset
+
+
+# Memoized on the user object: request.user lives exactly as long as the request,
+# so every check_* method and for_user() queryset used while handling it shares one query.
+class CourseAccessService:
+    CACHE_ATTR = '_course_access'
+
+    @staticmethod
+    def get_access(user: User) -> CourseAccess:
+        access = getattr(user, CourseAccessService.CACHE_ATTR, None)
+        if access is not None:
+            return access
+
+        teaching, enrolled = set(), set()
+        if user.is_authenticated:
+            taught = Course.teachers.through.objects.filter(user_id=user.pk).values_list(
+                'course_id', Value(True)
+            )
+            attended = Course.students.through.objects.filter(user_id=user.pk).values_list(
+                'course_id', Value(False)
+            )
+            for course_id, is_teacher in taught.union(attended, all=True):
+                (teaching if is_teacher else enrolled).add(course_id)
+
+        access = CourseAccess(frozenset(teaching), frozenset(enrolled))
+        setattr(user, CourseAccessService.CACHE_ATTR, access)
+        return access
+
+    @staticmethod
+    def teaches(user: User, course_id: int) -> bool:
+        return course_id in CourseAccessService.get_access(user).teaching
+
+    @staticmethod
+    def is_enrolled(user: User, course_id: int) -> bool:
+        return course_id in CourseAccessService.get_access(user).enrolled
+
+    @staticmethod
+    def invalidate(user: User):
+        user.__dict__.pop(CourseAccessService.CACHE_ATTR, None)
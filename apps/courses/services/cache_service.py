@@ -0,0 +1,69 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+# Payloads are keyed by a per-object version token. Invalidation swaps the token
+# instead of deleting payloads, so every rendering variant of an object (one per
+# host, because file URLs are absolute) goes stale at once.
+class ContentCacheService:
+    @staticmethod
+    def variant_for(request):
+        return f'{request.scheme}://{request.get_host()}' if request else ''
+
+    @staticmethod
+    def version_key(model, pk):
+        return f'content-version:{model._meta.label_lower}:{pk}'
+
+    @staticmethod
+    def payload_key(model, pk, version, variant):
+        return f'content:{model._meta.label_lower}:{pk}:{version}:{variant}'
+
+    @staticmethod
+    def get_versions(model, pks):
+        keys = {pk: ContentCacheService.version_key(model, pk) for pk in pks}
+        found = cache.get_many(keys.values())
+
+        versions, missing = {}, {}
+        for pk, key in keys.items():
+            if key in found:
+                versions[pk] = found[key]
+            else:
+                versions[pk] = missing[key] = uuid.uuid4().hex
+        if missing:
+            cache.set_many(missing, timeout=None)
+        return versions
+
+    @staticmethod
+    def invalidate(model, *pks):
+        cache.set_many(
+            {ContentCacheService.version_key(model, pk): uuid.uuid4().hex for pk in pks},
+            timeout=None,
+        )
+
+    @staticmethod
+    def get_payload(model, pk, variant):
+        version = ContentCacheService.get_versions(model, [pk])[pk]
+        return cache.get(
+            ContentCacheService.payload_key(model, pk, version, variant),
+            version=settings.CONTENT_CACHE_VERSION,
+        )
+
+    @staticmethod
+    def get_or_render(model, instances, render, variant):
+        versions = ContentCacheService.get_versions(model, [instance.pk for instance in instances])
+        keys = [
+            ContentCacheService.payload_key(model, instance.pk, versions[instance.pk], variant)
+            for instance in instances
+        ]
+        cached = cache.get_many(keys, version=settings.CONTENT_CACHE_VERSION)
+
+        payloads, rendered = [], {}
+        for instance, key in zip(instances, keys):
+            if key not in cached:
+                cached[key] = rendered[key] = render(instance)
+            payloads.append(cached[key])
+        if rendered:
+            cache.set_many(rendered, timeout=settings.CONTENT_CACHE_TIMEOUT, version=settings.CONTENT_CACHE_VERSION)
+        return payloads
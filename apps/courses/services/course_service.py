@@ -1,6 +1,13 @@
+import csv
+import io
+
+from django.db import transaction
 from rest_framework.exceptions import PermissionDenied
 from apps.users.models import User
-from apps.courses.models import Course
+from apps.courses.models import Course, Lecture, Homework
+from apps.courses.services.access_service import CourseAccessService
+from apps.courses.services.cache_service import ContentCacheService
+from apps.courses.services.stats_service import CourseStatsService
 
 
 class CourseService:
@@ -22,6 +29,119 @@ class CourseService:
         except User.DoesNotExist:
             return {"error": "Student not found"}, 400
 
+    @staticmethod
+    def add_students(course: Course, student_ids):
+        valid_ids, results = CourseService._normalize_ids(student_ids)
+        if not valid_ids and not results:
+            return {"error": "student_ids must be a non-empty list"}, 400
+
+        Enrollment = Course.students.through
+        students = set(
+            User.objects.filter(id__in=valid_ids, role=User.Role.STUDENT).values_list('id', flat=True)
+        )
+        with transaction.atomic():
+            enrolled = set(
+                Enrollment.objects.filter(course=course, user_id__in=students).values_list('user_id', flat=True)
+            )
+            Enrollment.objects.bulk_create(
+                [Enrollment(course=course, user_id=student_id) for student_id in students - enrolled],
+                ignore_conflicts=True,
+            )
+            Course.objects.filter(pk=course.pk).touch()
+        ContentCacheService.invalidate(Course, course.pk)
+
+        for student_id in valid_ids:
+            if student_id not in students:
+                status = "not found"
+            elif student_id in enrolled:
+                status = "already enrolled"
+            else:
+                status = "added"
+            results.append({"student_id": student_id, "status": status})
+        return {"results": results}, 200
+
+    @staticmethod
+    def remove_students(course: Course, student_ids):
+        valid_ids, results = CourseService._normalize_ids(student_ids)
+        if not valid_ids and not results:
+            return {"error": "student_ids must be a non-empty list"}, 400
+
+        Enrollment = Course.students.through
+        with transaction.atomic():
+            enrolled = set(
+                Enrollment.objects.filter(course=course, user_id__in=valid_ids).values_list('user_id', flat=True)
+            )
+            Enrollment.objects.filter(course=course, user_id__in=enrolled).delete()
+            Course.objects.filter(pk=course.pk).touch()
+        ContentCacheService.invalidate(Course, course.pk)
+
+        for student_id in valid_ids:
+            status = "removed" if student_id in enrolled else "not enrolled"
+            results.append({"student_id": student_id, "status": status})
+        return {"results": results}, 200
+
+    @staticmethod
+    def clone(course: Course, user: User, title=None):
+        # A fixed number of queries whatever the course size: one read and one bulk insert each for
+        # teachers, lectures and homeworks. Presentations keep their stored names, so the
+        # content-addressed blobs are shared rather than copied.
+        Teaching = Course.teachers.through
+        with transaction.atomic():
+            clone = Course.objects.create(
+                title=title or f"{course.title} (copy)", description=course.description
+            )
+            teacher_ids = Teaching.objects.filter(course=course).values_list('user_id', flat=True)
+            Teaching.objects.bulk_create([Teaching(course=clone, user_id=teacher_id) for teacher_id in teacher_ids])
+
+            lectures = list(Lecture.objects.filter(course=course).order_by('pk'))
+            lecture_ids = [lecture.pk for lecture in lectures]
+            for lecture in lectures:
+                lecture.pk = None
+                lecture.course = clone
+            Lecture.objects.bulk_create(lectures, batch_size=2000)
+            new_lecture_ids = dict(zip(lecture_ids, (lecture.pk for lecture in lectures)))
+
+            homeworks = list(Homework.objects.filter(lecture__course=course).order_by('pk'))
+            for homework in homeworks:
+                homework.pk = None
+                homework.lecture_id = new_lecture_ids[homework.lecture_id]
+            Homework.objects.bulk_create(homeworks, batch_size=2000)
+
+            CourseStatsService.rebuild(clone.pk)
+        CourseAccessService.invalidate(user)
+        return clone
+
+    @staticmethod
+    def check_gradebook_permissions(course: Course, user: User):
+        if not (user.is_superuser or CourseAccessService.teaches(user, course.id)):
+            raise PermissionDenied("You cannot view another teacher's gradebook.")
+
+    @staticmethod
+    def check_stats_permissions(course: Course, user: User):
+        if not (user.is_superuser or CourseAccessService.teaches(user, course.id)):
+            raise PermissionDenied("You cannot view another teacher's course statistics.")
+
+    @staticmethod
+    def read_student_ids_csv(file):
+        # None when the upload is not a readable UTF-8 CSV.
+        reader = csv.reader(io.TextIOWrapper(file, encoding='utf-8-sig'))
+        try:
+            return [row[0].strip() for row in reader if row and row[0].strip() and row[0].strip() != 'student_id']
+        except (UnicodeDecodeError, csv.Error):
+            return None
+
+    @staticmethod
+    def _normalize_ids(raw_ids):
+        if not isinstance(raw_ids, (list, tuple)):
+            return [], []
+        valid_ids, errors = [], []
+        for raw_id in raw_ids:
+            try:
+                valid_ids.append(int(raw_id))
+            except (TypeError, ValueError):
+                errors.append({"student_id": raw_id, "status": "invalid id"})
+        return list(dict.fromkeys(valid_ids)), errors
+
     @staticmethod
     def add_teacher(course: Course, teacher_id: int):
         try:
@@ -33,5 +153,10 @@ class CourseService:
 
     @staticmethod
     def check_edit_permissions(course: Course, user: User):
-        if not (user.is_superuser or course.teachers.filter(id=user.id).exists()):
+        if not (user.is_superuser or CourseAccessService.teaches(user, course.id)):
             raise PermissionDenied("You cannot modify another teacher's course.")
+
+    @staticmethod
+    def check_roster_permissions(course: Course, user: User):
+        if not (user.is_superuser or CourseAccessService.teaches(user, course.id)):
+            raise PermissionDenied("You cannot view another teacher's course roster.")
@@ -1,15 +1,16 @@
 from rest_framework.exceptions import PermissionDenied
 from apps.courses.models import Homework
+from apps.courses.services.access_service import CourseAccessService
 from apps.users.models import User
 
 
 class HomeworkService:
     @staticmethod
     def check_edit_permissions(homework: Homework, user: User):
-        if not (user.is_superuser or homework.lecture.course.teachers.filter(id=user.id).exists()):
+        if not (user.is_superuser or CourseAccessService.teaches(user, homework.lecture.course_id)):
             raise PermissionDenied("You cannot modify another teacher's homework.")
 
     @staticmethod
     def check_create_permissions(lecture, user):
-        if not (user.is_superuser or user in lecture.course.teachers.all()):
+        if not (user.is_superuser or CourseAccessService.teaches(user, lecture.course_id)):
             raise PermissionDenied("You are not a teacher of this course")
\ No newline at end of file
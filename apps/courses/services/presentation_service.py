@@ -0,0 +1,287 @@
+import hashlib
+import mimetypes
+import re
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files import File, locks
+from django.http import FileResponse, HttpResponse
+from django.utils.http import quote_etag
+from rest_framework import status
+
+from apps.courses.models import Lecture, PresentationUpload
+from apps.courses.services.access_service import CourseAccessService
+from apps.users.models import User
+
+
+class AssembledFile(File):
+    # FileSystemStorage moves files that expose temporary_file_path() instead of copying them.
+    def temporary_file_path(self):
+        return self.name
+
+
+# Resumable uploads in three steps: init declares the size and SHA-256, append writes
+# the request body at Upload-Offset straight to a part file in PRESENTATION_CHUNK_SIZE
+# pieces, complete verifies the checksum and moves the file onto the lecture.
+class PresentationUploadService:
+    SHA256_RE = re.compile(r'^[0-9a-f]{64}$')
+
+    @staticmethod
+    def part_path(upload: PresentationUpload):
+        return settings.PRESENTATION_UPLOAD_TEMP_DIR / f'{upload.pk}.part'
+
+    @staticmethod
+    def serialize(upload: PresentationUpload):
+        return {
+            "id": str(upload.pk),
+            "lecture": upload.lecture_id,
+            "filename": upload.filename,
+            "size": upload.size,
+            "offset": upload.offset,
+        }
+
+    @staticmethod
+    def init(lecture: Lecture, user: User, data):
+        filename = str(data.get('filename') or '').strip()
+        sha256 = str(data.get('sha256') or '').lower()
+        try:
+            size = int(data.get('size'))
+        except (TypeError, ValueError):
+            return {"error": "size must be an integer"}, status.HTTP_400_BAD_REQUEST
+
+        if not filename:
+            return {"error": "filename is required"}, status.HTTP_400_BAD_REQUEST
+        if not 0 < size <= settings.PRESENTATION_MAX_SIZE:
+            return {"error": f"size must be between 1 and {settings.PRESENTATION_MAX_SIZE}"}, \
+                status.HTTP_400_BAD_REQUEST
+        if not PresentationUploadService.SHA256_RE.match(sha256):
+            return {"error": "sha256 must be a hex digest"}, status.HTTP_400_BAD_REQUEST
+
+        existing = PresentationUploadService.find_known_blob(user, sha256)
+        if existing is not None:
+            PresentationUploadService.attach(lecture, existing)
+            return {"lecture": lecture.pk, "presentation": existing, "deduplicated": True}, status.HTTP_200_OK
+
+        upload = PresentationUpload.objects.create(
+            lecture=lecture, created_by=user, filename=filename[-255:], size=size, sha256=sha256
+        )
+        path = PresentationUploadService.part_path(upload)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        return PresentationUploadService.serialize(upload), status.HTTP_201_CREATED
+
+    @staticmethod
+    def find_known_blob(user: User, sha256):
+        # Skip the transfer when the deck is already stored for a course this user teaches;
+        # limiting it to their own courses keeps a bare hash from granting access to a file.
+        lectures = Lecture.objects.filter(presentation_sha256=sha256)
+        if not user.is_superuser:
+            lectures = lectures.filter(course_id__in=CourseAccessService.get_access(user).teaching)
+        return lectures.values_list('presentation', flat=True).first()
+
+    @staticmethod
+    def attach(lecture: Lecture, name):
+        lecture.presentation.name = name
+        lecture.save(update_fields=['presentation', 'updated_at'])
+
+    @staticmethod
+    def append(upload: PresentationUpload, offset, stream, length):
+        try:
+            offset, length = int(offset), int(length or 0)
+        except (TypeError, ValueError):
+            return {"error": "Upload-Offset and Content-Length must be integers"}, status.HTTP_400_BAD_REQUEST
+
+        with PresentationUploadService.part_path(upload).open('r+b') as part:
+            # The part file lock serializes appends while the body streams in, so no database row
+            # lock or transaction is held for the duration of a (possibly slow) client upload.
+            if not locks.lock(part, locks.LOCK_EX | locks.LOCK_NB):
+                return {"error": "Another chunk is being written"}, status.HTTP_409_CONFLICT
+            try:
+                upload = PresentationUpload.objects.filter(pk=upload.pk).first()
+                if upload is None:
+                    return {"error": "Upload no longer exists"}, status.HTTP_404_NOT_FOUND
+                if offset != upload.offset:
+                    data = PresentationUploadService.serialize(upload)
+                    data["error"] = "Upload-Offset does not match the uploaded size"
+                    return data, status.HTTP_409_CONFLICT
+                if offset + length > upload.size:
+                    return {"error": "Chunk exceeds the declared size"}, status.HTTP_400_BAD_REQUEST
+
+                # Drop bytes past the recorded offset left by an interrupted append.
+                part.seek(offset)
+                part.truncate()
+                written = 0
+                while written < length:
+                    chunk = stream.read(min(settings.PRESENTATION_CHUNK_SIZE, length - written))
+                    if not chunk:
+                        break
+                    part.write(chunk)
+                    written += len(chunk)
+                part.flush()
+
+                # Advance only from the offset checked above; a discarded upload updates nothing.
+                advanced = PresentationUpload.objects.filter(pk=upload.pk, offset=offset).update(
+                    offset=offset + written
+                )
+                if not advanced:
+                    return {"error": "Upload no longer exists"}, status.HTTP_404_NOT_FOUND
+                upload.offset = offset + written
+            finally:
+                locks.unlock(part)
+        return PresentationUploadService.serialize(upload), status.HTTP_200_OK
+
+    @staticmethod
+    def checksum(path):
+        digest = hashlib.sha256()
+        with path.open('rb') as file:
+            for chunk in iter(lambda: file.read(settings.PRESENTATION_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def complete(upload: PresentationUpload):
+        if upload.offset != upload.size:
+            data = PresentationUploadService.serialize(upload)
+            data["error"] = "Upload is incomplete"
+            return data, status.HTTP_400_BAD_REQUEST
+
+        path = PresentationUploadService.part_path(upload)
+        if PresentationUploadService.checksum(path) != upload.sha256:
+            PresentationUploadService.discard(upload)
+            return {"error": "Checksum mismatch; start the upload again"}, status.HTTP_400_BAD_REQUEST
+
+        lecture = upload.lecture
+        with path.open('rb') as part:
+            assembled = AssembledFile(part, name=str(path))
+            assembled.sha256 = upload.sha256
+            lecture.presentation.save(upload.filename, assembled, save=False)
+        lecture.save(update_fields=['presentation', 'updated_at'])
+        PresentationUploadService.discard(upload)
+        return {"lecture": lecture.pk, "presentation": lecture.presentation.name}, status.HTTP_200_OK
+
+    @staticmethod
+    def discard(upload: PresentationUpload):
+        PresentationUploadService.part_path(upload).unlink(missing_ok=True)
+        upload.delete()
+
+    @staticmethod
+    def last_activity(upload: PresentationUpload):
+        try:
+            modified = PresentationUploadService.part_path(upload).stat().st_mtime
+        except FileNotFoundError:
+            return upload.created_at
+        return max(upload.created_at, datetime.fromtimestamp(modified, tz=timezone.utc))
+
+    @staticmethod
+    def expire(cutoff, dry_run=False):
+        # Uploads idle since the cutoff, plus part files whose row is gone (a deleted lecture
+        # cascades its uploads but leaves their files behind).
+        expired = freed = 0
+        known = set()
+        for upload in PresentationUpload.objects.iterator():
+            path = PresentationUploadService.part_path(upload)
+            known.add(path.name)
+            if PresentationUploadService.last_activity(upload) >= cutoff:
+                continue
+            freed += path.stat().st_size if path.exists() else 0
+            expired += 1
+            if not dry_run:
+                PresentationUploadService.discard(upload)
+
+        temp_dir = settings.PRESENTATION_UPLOAD_TEMP_DIR
+        for path in temp_dir.glob('*.part') if temp_dir.exists() else ():
+            stat = path.stat()
+            if path.name in known or datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc) >= cutoff:
+                continue
+            freed += stat.st_size
+            expired += 1
+            if not dry_run:
+                path.unlink(missing_ok=True)
+        return expired, freed
+
+
+class FileRange:
+    # Caps reads at the requested range. fileno() is kept so a WSGI server's file_wrapper
+    # can still sendfile() from the current offset for Content-Length bytes.
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size) if size else b''
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+class PresentationDownloadService:
+    RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+    @staticmethod
+    def parse_range(header, size):
+        # Returns (start, end) for a single satisfiable range, None to send the whole file
+        # (no header, or a multi-range request) and raises ValueError when unsatisfiable.
+        match = PresentationDownloadService.RANGE_RE.match(header.replace(' ', '')) if header else None
+        if match is None:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            start, end = max(size - int(last), 0), size - 1
+        else:
+            start, end = int(first), min(int(last), size - 1) if last else size - 1
+        if start > end or start >= size:
+            raise ValueError(header)
+        return start, end
+
+    @staticmethod
+    def serve(request, lecture: Lecture):
+        presentation = lecture.presentation
+        filename = presentation.name.rsplit('/', 1)[-1]
+        content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        etag = quote_etag(f'{presentation.name}-{lecture.updated_at.timestamp():.6f}')
+
+        if settings.PRESENTATION_SENDFILE:
+            response = HttpResponse(content_type=content_type)
+            if settings.PRESENTATION_SENDFILE == 'x-accel':
+                response['X-Accel-Redirect'] = settings.PRESENTATION_ACCEL_PREFIX + quote(presentation.name)
+            else:
+                response['X-Sendfile'] = presentation.path
+        else:
+            size = presentation.size
+            header = request.headers.get('Range')
+            if header and request.headers.get('If-Range', etag) != etag:
+                header = None
+            try:
+                byte_range = PresentationDownloadService.parse_range(header, size)
+            except ValueError:
+                response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+            file = presentation.open('rb')
+            if byte_range is None:
+                response = FileResponse(file, content_type=content_type)
+            else:
+                start, end = byte_range
+                response = FileResponse(
+                    FileRange(file, start, end - start + 1),
+                    status=status.HTTP_206_PARTIAL_CONTENT,
+                    content_type=content_type,
+                )
+                response['Content-Length'] = end - start + 1
+                response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+        response['Accept-Ranges'] = 'bytes'
+        response['ETag'] = etag
+        response['Content-Disposition'] = f"inline; filename*=UTF-8''{quote(filename)}"
+        return response
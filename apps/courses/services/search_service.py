@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Value
+from django.db.models.functions import Left
+
+from apps.courses.models import Lecture, Homework, search_vector
+from apps.submissions.models import Submission
+from apps.users.models import User
+
+
+# Matching uses the GIN-indexed search_vector columns; every source is scoped by its
+# for_user() queryset and the three are merged with UNION ALL, ranked in the database.
+class SearchService:
+    SNIPPET_LENGTH = 200
+    SOURCES = {
+        'lecture': (Lecture, 'course_id'),
+        'homework': (Homework, 'lecture__course_id'),
+        'submission': (Submission, 'course_id'),
+    }
+
+    @staticmethod
+    def refresh(queryset):
+        return queryset.update(search_vector=search_vector(queryset.model.SEARCH_FIELD))
+
+    @staticmethod
+    def parse_kinds(raw):
+        if not raw:
+            return list(SearchService.SOURCES)
+        kinds = [kind.strip() for kind in raw.split(',') if kind.strip()]
+        unknown = set(kinds) - SearchService.SOURCES.keys()
+        if unknown:
+            raise ValueError(f"Unknown type: {', '.join(sorted(unknown))}")
+        return kinds
+
+    @staticmethod
+    def search(user: User, text, kinds):
+        query = SearchQuery(text, search_type='websearch', config=settings.SEARCH_CONFIG)
+        parts = []
+        for kind in kinds:
+            model, course_field = SearchService.SOURCES[kind]
+            parts.append(
+                model.objects.for_user(user)
+                .filter(search_vector=query)
+                .annotate(
+                    kind=Value(kind),
+                    object_id=F('pk'),
+                    course_pk=F(course_field),
+                    snippet=Left(model.SEARCH_FIELD, SearchService.SNIPPET_LENGTH),
+                    rank=SearchRank(F('search_vector'), query),
+                )
+                .values('kind', 'object_id', 'course_pk', 'snippet', 'rank')
+                .order_by()
+            )
+        results = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+        return results.order_by('-rank', 'kind', 'object_id')
@@ -0,0 +1,64 @@
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from apps.courses.models import Course, CourseStats, Lecture, Homework
+from apps.submissions.models import Submission, Grade
+
+
+def _per_course(queryset, course_field, aggregate):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{course_field: OuterRef('pk')})
+            .order_by()
+            .values(course_field)
+            .annotate(value=aggregate)
+            .values('value'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+class CourseStatsService:
+    STAT_FIELDS = [
+        'lecture_count', 'homework_count', 'submission_count',
+        'ungraded_submission_count', 'grade_count', 'grade_total',
+    ]
+
+    @staticmethod
+    def increment(course_id, **deltas):
+        # A missing row is left alone: the stats action rebuilds it on first read. Recreating it here
+        # would also resurrect the row of a course whose delete cascade already removed it.
+        if course_id is None:
+            return
+        CourseStats.objects.filter(course_id=course_id).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+
+    @staticmethod
+    def rebuild(*course_ids):
+        courses = Course.objects.all()
+        if course_ids:
+            courses = courses.filter(pk__in=course_ids)
+
+        rows = courses.annotate(
+            lecture_count=_per_course(Lecture.objects, 'course', Count('pk')),
+            homework_count=_per_course(Homework.objects, 'lecture__course', Count('pk')),
+            submission_count=_per_course(Submission.objects, 'course', Count('pk')),
+            ungraded_submission_count=_per_course(Submission.objects, 'course', Count('pk', filter=Q(is_graded=False))),
+            grade_count=_per_course(Grade.objects, 'course', Count('pk')),
+            grade_total=_per_course(Grade.objects, 'course', Sum('grade')),
+        ).values('pk', *CourseStatsService.STAT_FIELDS)
+
+        stats = [
+            CourseStats(course_id=row.pop('pk'), **row)
+            for row in rows.iterator(chunk_size=2000)
+        ]
+        CourseStats.objects.bulk_create(
+            stats,
+            batch_size=2000,
+            update_conflicts=True,
+            unique_fields=['course'],
+            update_fields=CourseStatsService.STAT_FIELDS,
+        )
+        return len(stats)
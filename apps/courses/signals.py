@@ -0,0 +1,79 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.courses.models import Course, CourseStats, Lecture, Homework, SERIALIZED_USER_FIELDS
+from apps.courses.services.cache_service import ContentCacheService
+from apps.courses.services.stats_service import CourseStatsService
+from apps.users.models import User
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Lecture)
+@receiver(post_save, sender=Homework)
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Lecture)
+@receiver(post_delete, sender=Homework)
+def invalidate_content(sender, instance, **kwargs):
+    ContentCacheService.invalidate(sender, instance.pk)
+
+
+@receiver(m2m_changed, sender=Course.teachers.through)
+@receiver(m2m_changed, sender=Course.students.through)
+def invalidate_course_members(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            Course.objects.filter(pk=instance.pk).touch()
+            ContentCacheService.invalidate(Course, instance.pk)
+        return
+
+    if action in ('post_add', 'post_remove'):
+        course_ids = pk_set
+    elif action == 'pre_clear':
+        course_ids = list(sender.objects.filter(user_id=instance.pk).values_list('course_id', flat=True))
+    else:
+        return
+    Course.objects.filter(pk__in=course_ids).touch()
+    ContentCacheService.invalidate(Course, *course_ids)
+
+
+# Course payloads and validators embed their teachers, so a teacher's profile change makes
+# them stale. Deletes are caught before the cascade removes the membership rows.
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def invalidate_teacher_courses(sender, instance, created=False, update_fields=None, **kwargs):
+    if created or (update_fields is not None and not set(update_fields) & set(SERIALIZED_USER_FIELDS)):
+        return
+    course_ids = list(
+        Course.teachers.through.objects.filter(user_id=instance.pk).values_list('course_id', flat=True)
+    )
+    if course_ids:
+        Course.objects.filter(pk__in=course_ids).touch()
+        ContentCacheService.invalidate(Course, *course_ids)
+
+
+@receiver(post_save, sender=Course)
+def create_course_stats(sender, instance, created, **kwargs):
+    if created:
+        CourseStats.objects.get_or_create(course=instance)
+
+
+@receiver(post_save, sender=Lecture)
+def count_created_lecture(sender, instance, created, **kwargs):
+    if created:
+        CourseStatsService.increment(instance.course_id, lecture_count=1)
+
+
+@receiver(post_delete, sender=Lecture)
+def count_deleted_lecture(sender, instance, **kwargs):
+    CourseStatsService.increment(instance.course_id, lecture_count=-1)
+
+
+@receiver(post_save, sender=Homework)
+def count_created_homework(sender, instance, created, **kwargs):
+    if created:
+        CourseStatsService.increment(instance.lecture.course_id, homework_count=1)
+
+
+@receiver(post_delete, sender=Homework)
+def count_deleted_homework(sender, instance, **kwargs):
+    CourseStatsService.increment(instance.lecture.course_id, homework_count=-1)
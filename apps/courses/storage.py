@@ -0,0 +1,52 @@
+import hashlib
+import os
+import posixpath
+import re
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+# Stores each distinct file once under <prefix>/<h[:2]>/<sha256><ext>. Saving content that
+# is already stored returns the existing name without writing, so every Lecture pointing at
+# the same deck shares one blob. Blobs are never deleted on save or delete; the
+# gc_presentations command removes those no Lecture references any more.
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    DIGEST_RE = re.compile(r'^([0-9a-f]{64})')
+
+    @staticmethod
+    def hash_content(content):
+        digest = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def blob_name(digest, name):
+        directory, filename = posixpath.split(name)
+        extension = posixpath.splitext(filename)[1].lower()[:16]
+        return posixpath.join(directory, digest[:2], f'{digest}{extension}')
+
+    @staticmethod
+    def digest_from_name(name):
+        match = ContentAddressedStorage.DIGEST_RE.match(posixpath.basename(name or ''))
+        return match.group(1) if match else ''
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        # Callers that already verified the content (resumable uploads) pass its digest along.
+        digest = getattr(content, 'sha256', None) or self.hash_content(content)
+        name = self.blob_name(digest, name)
+        if self.exists(name):
+            # gc_presentations spares recently modified blobs; refresh the mtime so a blob that is
+            # about to be referenced again is not deleted by a collection that listed it as unused.
+            os.utime(self.path(name))
+            return name
+        return super().save(name, content, max_length=max_length)
+
+
+presentation_storage = ContentAddressedStorage()
@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.courses.services.access_service import CourseAccessService
+from apps.courses.services.course_service import CourseService
+from apps.courses.services.homework_service import HomeworkService
+from apps.courses.services.lecture_service import LectureService
+from apps.users.models import User
+
+
+class CourseAccessTests(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        self.course.students.add(self.student)
+        self.other_course = Course.objects.create(title="Go", description="Learn Go")
+
+        self.lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+        self.homework = Homework.objects.create(lecture=self.lecture, text="Task 1")
+
+    def test_access_sets(self):
+        teacher_access = CourseAccessService.get_access(self.teacher)
+        student_access = CourseAccessService.get_access(self.student)
+
+        self.assertEqual(teacher_access.teaching, {self.course.id})
+        self.assertEqual(teacher_access.enrolled, set())
+        self.assertEqual(student_access.enrolled, {self.course.id})
+
+    def test_checks_share_a_single_query(self):
+        # membership lookup + the course list itself
+        with self.assertNumQueries(2):
+            CourseService.check_edit_permissions(self.course, self.teacher)
+            LectureService.check_create_permissions(self.course, self.teacher)
+            LectureService.check_edit_permissions(self.lecture, self.teacher)
+            HomeworkService.check_create_permissions(self.lecture, self.teacher)
+            HomeworkService.check_edit_permissions(self.homework, self.teacher)
+            list(Course.objects.for_user(self.teacher))
+
+    def test_invalidate(self):
+        CourseAccessService.get_access(self.teacher)
+        self.other_course.teachers.add(self.teacher)
+        self.assertFalse(CourseAccessService.teaches(self.teacher, self.other_course.id))
+
+        CourseAccessService.invalidate(self.teacher)
+        self.assertTrue(CourseAccessService.teaches(self.teacher, self.other_course.id))
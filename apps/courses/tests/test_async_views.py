@@ -0,0 +1,67 @@
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture
+from apps.users.models import User
+
+
+class AsyncReadViewTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.token = str(AccessToken.for_user(self.teacher))
+        self.courses = [Course.objects.create(title=f"Course {i}", description="") for i in range(3)]
+        self.courses[0].teachers.add(self.teacher)
+        self.lecture = Lecture.objects.create(course=self.courses[0], topic="Lesson 1")
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_list_paginates_by_keyset(self):
+        url = reverse('async-courses-list')
+        response = self.client.get(url, {'limit': 2}, **self.get_auth_headers(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual([course['id'] for course in data['results']], [c.id for c in self.courses[:2]])
+        self.assertEqual(data['results'][0]['teachers'][0]['username'], "teacher")
+        self.assertEqual(data['results'][0]['student_count'], 0)
+
+        response = self.client.get(data['next'], **self.get_auth_headers(self.token))
+        data = response.json()
+        self.assertEqual([course['id'] for course in data['results']], [self.courses[2].id])
+        self.assertIsNone(data['next'])
+
+    def test_retrieve_matches_sync_endpoint(self):
+        url = reverse('async-lectures-detail', args=[self.lecture.id])
+        response = self.client.get(url, **self.get_auth_headers(self.token))
+        sync_response = self.client.get(
+            reverse('lectures-detail', args=[self.lecture.id]), **self.get_auth_headers(self.token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+
+    def test_missing_object_and_credentials(self):
+        url = reverse('async-homeworks-detail', args=[999999])
+        self.assertEqual(
+            self.client.get(url, **self.get_auth_headers(self.token)).status_code, status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalid_cursor(self):
+        url = reverse('async-courses-list')
+        response = self.client.get(url, {'after': 'x'}, **self.get_auth_headers(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_served_through_asgi_handler(self):
+        response = await AsyncClient().get(
+            reverse('async-courses-detail', args=[self.courses[0].id]),
+            headers={'Authorization': f'Bearer {self.token}'},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['title'], "Course 0")
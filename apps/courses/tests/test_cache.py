@@ -0,0 +1,86 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture
+from apps.users.models import User
+
+
+class ContentCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        self.lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_cached_retrieve_skips_queries(self):
+        url = reverse('lectures-detail', args=[self.lecture.id])
+        self.client.get(url, **self.get_auth_headers(self.teacher_token))
+
+        # only the updated_at validator lookup remains; the JWT user state is cached
+        with self.assertNumQueries(1):
+            response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['topic'], "Lesson 1")
+
+    def test_save_invalidates_payload(self):
+        url = reverse('lectures-detail', args=[self.lecture.id])
+        self.client.get(url, **self.get_auth_headers(self.teacher_token))
+
+        self.lecture.topic = "Renamed"
+        self.lecture.save()
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['topic'], "Renamed")
+
+    def test_delete_invalidates_payload(self):
+        url = reverse('lectures-detail', args=[self.lecture.id])
+        self.client.get(url, **self.get_auth_headers(self.teacher_token))
+
+        self.lecture.delete()
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_enrollment_invalidates_course_payload(self):
+        url = reverse('courses-detail', args=[self.course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['student_count'], 0)
+
+        self.student.enrolled_courses.add(self.course)
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['student_count'], 1)
+
+        bulk_url = reverse('courses-remove-students', args=[self.course.id])
+        self.client.post(
+            bulk_url, {"student_ids": [self.student.id]}, format='json', **self.get_auth_headers(self.teacher_token)
+        )
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['student_count'], 0)
+
+    def test_teacher_rename_invalidates_course_payload(self):
+        url = reverse('courses-detail', args=[self.course.id])
+        self.client.get(url, **self.get_auth_headers(self.teacher_token))
+
+        self.teacher.username = "renamed"
+        self.teacher.save()
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual([teacher['username'] for teacher in response.data['teachers']], ["renamed"])
+
+    def test_list_uses_cached_payloads(self):
+        url = reverse('lectures-list')
+        self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        Lecture.objects.filter(pk=self.lecture.pk).update(topic="Updated behind the cache")
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['results'][0]['topic'], "Lesson 1")
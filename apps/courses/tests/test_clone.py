@@ -0,0 +1,84 @@
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, CourseStats, Lecture, Homework
+from apps.courses.services.course_service import CourseService
+from apps.users.models import User
+
+
+class CourseCloneTests(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.co_teacher = User.objects.create_user(username="co_teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other_teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.other_teacher_token = str(AccessToken.for_user(self.other_teacher))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher, self.co_teacher)
+        self.course.students.add(self.student)
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def add_lectures(self, count):
+        for i in range(count):
+            lecture = Lecture.objects.create(course=self.course, topic=f"Lesson {i}")
+            Homework.objects.create(lecture=lecture, text=f"Task {i}.1")
+            Homework.objects.create(lecture=lecture, text=f"Task {i}.2")
+
+    def test_clone_copies_structure(self):
+        self.add_lectures(2)
+        lecture = Lecture.objects.filter(course=self.course).first()
+        lecture.presentation.save("deck.pdf", ContentFile(b"slides"))
+
+        url = reverse('courses-clone', args=[self.course.id])
+        response = self.client.post(url, {"title": "Python, autumn"}, format='json',
+                                    **self.get_auth_headers(self.teacher_token))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['title'], "Python, autumn")
+        self.assertEqual(response.data['student_count'], 0)
+        clone = Course.objects.get(pk=response.data['id'])
+        self.assertEqual(set(clone.teachers.all()), {self.teacher, self.co_teacher})
+
+        topics = list(clone.lectures.order_by('pk').values_list('topic', flat=True))
+        self.assertEqual(topics, ["Lesson 0", "Lesson 1"])
+        tasks = Homework.objects.filter(lecture__course=clone).values_list('lecture__topic', 'text')
+        self.assertEqual(sorted(tasks), [
+            ("Lesson 0", "Task 0.1"), ("Lesson 0", "Task 0.2"), ("Lesson 1", "Task 1.1"), ("Lesson 1", "Task 1.2"),
+        ])
+
+        copied = clone.lectures.get(topic=lecture.topic)
+        self.assertEqual(copied.presentation.name, lecture.presentation.name)
+        self.assertEqual(copied.presentation_sha256, lecture.presentation_sha256)
+        self.assertEqual(CourseStats.objects.get(course=clone).homework_count, 4)
+
+    def test_clone_runs_a_constant_number_of_queries(self):
+        self.add_lectures(1)
+        with self.assertNumQueries(15) as small:
+            CourseService.clone(self.course, self.teacher)
+
+        self.add_lectures(20)
+        with self.assertNumQueries(len(small.captured_queries)):
+            CourseService.clone(self.course, self.teacher)
+
+    def test_other_teacher_cannot_clone(self):
+        url = reverse('courses-clone', args=[self.course.id])
+        response = self.client.post(url, {}, format='json', **self.get_auth_headers(self.other_teacher_token))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
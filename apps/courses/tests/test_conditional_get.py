@@ -0,0 +1,96 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.users.models import User
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        self.lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+        self.homework = Homework.objects.create(lecture=self.lecture, text="Task 1")
+
+    def get_auth_headers(self, token, **extra):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}', **extra}
+
+    def test_retrieve_returns_304_for_matching_etag(self):
+        url = reverse('homeworks-detail', args=[self.homework.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=response['ETag'])
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_etag_changes_on_update(self):
+        url = reverse('homeworks-detail', args=[self.homework.id])
+        etag = self.client.get(url, **self.get_auth_headers(self.teacher_token))['ETag']
+
+        self.homework.text = "Task 1, revised"
+        self.homework.save()
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['text'], "Task 1, revised")
+
+    def test_course_etag_changes_on_enrollment(self):
+        url = reverse('courses-detail', args=[self.course.id])
+        etag = self.client.get(url, **self.get_auth_headers(self.teacher_token))['ETag']
+
+        self.course.students.add(self.student)
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['student_count'], 1)
+
+    def test_malformed_pk_is_not_found(self):
+        for basename in ('courses', 'lectures', 'homeworks'):
+            url = reverse(f'{basename}-detail', args=['abc'])
+            response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, basename)
+
+    def test_course_etag_changes_on_teacher_rename(self):
+        url = reverse('courses-detail', args=[self.course.id])
+        etag = self.client.get(url, **self.get_auth_headers(self.teacher_token))['ETag']
+
+        self.teacher.username = "renamed"
+        self.teacher.save()
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['teachers'][0]['username'], "renamed")
+
+    def test_course_list_validator_skips_enrollment_join(self):
+        url = reverse('courses-list')
+        etag = self.client.get(url, **self.get_auth_headers(self.teacher_token))['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=etag))
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(any('courses_course_students' in query['sql'] for query in queries.captured_queries))
+
+    def test_list_returns_304_until_collection_changes(self):
+        url = reverse('lectures-list')
+        etag = self.client.get(url, **self.get_auth_headers(self.teacher_token))['ETag']
+
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Lecture.objects.create(course=self.course, topic="Lesson 2")
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
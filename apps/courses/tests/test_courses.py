@@ -28,6 +28,7 @@ class CourseTests(APITestCase):
 
         course = Course.objects.get()
         self.assertTrue(course.teachers.filter(id=self.teacher.id).exists())
+        self.assertEqual(response.data['student_count'], 0)
 
     def test_student_cannot_create_course(self):
         url = reverse('courses-list')
@@ -50,8 +51,8 @@ class CourseTests(APITestCase):
         url = reverse('courses-list')
         response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], "Django")
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], "Django")
 
     def test_get_courses_unauthenticated(self):
         course = Course.objects.create(title="Django", description="Web framework")
@@ -74,12 +75,14 @@ class CourseTests(APITestCase):
     def test_update_course(self):
         course = Course.objects.create(title="Old Title", description="Old Description")
         course.teachers.add(self.teacher)
+        course.students.add(self.student)
 
         url = reverse('courses-detail', args=[course.id])
         data = {"title": "Updated Title", "description": "Updated Description"}
         response = self.client.put(url, data, format='json', **self.get_auth_headers(self.teacher_token))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['student_count'], 1)
 
         course.refresh_from_db()
         self.assertEqual(course.title, "Updated Title")
@@ -108,3 +111,51 @@ class CourseTests(APITestCase):
         response = self.client.post(url, data, format='json', **self.get_auth_headers(self.teacher_token))
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(Course.objects.count(), 0)
+
+    def test_course_list_query_count_does_not_grow(self):
+        for i in range(5):
+            course = Course.objects.create(title=f"Course {i}", description="Desc")
+            course.teachers.add(self.teacher)
+            course.students.add(self.student)
+
+        url = reverse('courses-list')
+        # auth user lookup + ETag aggregate + annotated courses + teachers prefetch
+        with self.assertNumQueries(4):
+            response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertEqual(response.data['results'][0]['teachers'][0]['username'], "teacher")
+        self.assertEqual(response.data['results'][0]['student_count'], 1)
+
+    def test_teacher_can_list_course_students(self):
+        course = Course.objects.create(title="Django", description="Web framework")
+        course.teachers.add(self.teacher)
+        course.students.add(self.student)
+
+        url = reverse('courses-students', args=[course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['username'] for s in response.data['results']], ["student"])
+
+    def test_student_cannot_list_course_students(self):
+        course = Course.objects.create(title="Django", description="Web framework")
+        course.students.add(self.student)
+
+        url = reverse('courses-students', args=[course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.student_token))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_course_list_is_cursor_paginated(self):
+        for i in range(3):
+            course = Course.objects.create(title=f"Course {i}", description="Desc")
+            course.teachers.add(self.teacher)
+
+        url = reverse('courses-list')
+        response = self.client.get(url, {'page_size': 2}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([c['title'] for c in response.data['results']], ["Course 0", "Course 1"])
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get(response.data['next'], **self.get_auth_headers(self.teacher_token))
+        self.assertEqual([c['title'] for c in response.data['results']], ["Course 2"])
+        self.assertIsNone(response.data['next'])
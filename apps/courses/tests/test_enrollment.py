@@ -0,0 +1,93 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course
+from apps.users.models import User
+
+
+class BulkEnrollmentTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other_teacher", password="123", role="teacher")
+        self.students = [
+            User.objects.create_user(username=f"student{i}", password="123", role="student") for i in range(3)
+        ]
+
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.other_teacher_token = str(AccessToken.for_user(self.other_teacher))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        self.course.students.add(self.students[0])
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_add_students_reports_per_id_results(self):
+        url = reverse('courses-add-students', args=[self.course.id])
+        student_ids = [s.id for s in self.students] + [self.teacher.id, 999, "abc"]
+        response = self.client.post(
+            url, {"student_ids": student_ids}, format='json', **self.get_auth_headers(self.teacher_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statuses = {r["student_id"]: r["status"] for r in response.data["results"]}
+        self.assertEqual(statuses[self.students[0].id], "already enrolled")
+        self.assertEqual(statuses[self.students[1].id], "added")
+        self.assertEqual(statuses[self.students[2].id], "added")
+        self.assertEqual(statuses[self.teacher.id], "not found")
+        self.assertEqual(statuses[999], "not found")
+        self.assertEqual(statuses["abc"], "invalid id")
+        self.assertEqual(self.course.students.count(), 3)
+
+    def test_add_students_from_csv(self):
+        url = reverse('courses-add-students', args=[self.course.id])
+        content = "student_id\n" + "\n".join(str(s.id) for s in self.students[1:])
+        upload = SimpleUploadedFile("cohort.csv", content.encode(), content_type="text/csv")
+        response = self.client.post(
+            url, {"file": upload}, format='multipart', **self.get_auth_headers(self.teacher_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.course.students.count(), 3)
+
+    def test_add_students_rejects_non_utf8_csv(self):
+        url = reverse('courses-add-students', args=[self.course.id])
+        content = "student_id\n# Kohorte für Müller\n" + str(self.students[1].id)
+        upload = SimpleUploadedFile("cohort.csv", content.encode('latin-1'), content_type="text/csv")
+        response = self.client.post(
+            url, {"file": upload}, format='multipart', **self.get_auth_headers(self.teacher_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.data)
+
+    def test_add_students_requires_list(self):
+        url = reverse('courses-add-students', args=[self.course.id])
+        response = self.client.post(url, {"student_ids": 5}, format='json', **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_remove_students(self):
+        url = reverse('courses-remove-students', args=[self.course.id])
+        student_ids = [self.students[0].id, self.students[1].id]
+        response = self.client.post(
+            url, {"student_ids": student_ids}, format='json', **self.get_auth_headers(self.teacher_token)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statuses = {r["student_id"]: r["status"] for r in response.data["results"]}
+        self.assertEqual(statuses[self.students[0].id], "removed")
+        self.assertEqual(statuses[self.students[1].id], "not enrolled")
+        self.assertEqual(self.course.students.count(), 0)
+
+    def test_other_teacher_cannot_add_students(self):
+        url = reverse('courses-add-students', args=[self.course.id])
+        response = self.client.post(
+            url, {"student_ids": [self.students[1].id]}, format='json',
+            **self.get_auth_headers(self.other_teacher_token)
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.course.students.count(), 1)
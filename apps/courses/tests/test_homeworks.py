@@ -88,7 +88,7 @@ class HomeworkTests(APITestCase):
         url = reverse('homeworks-list')
         response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_get_homework_detail(self):
         homework = Homework.objects.create(lecture=self.lecture, text="Detailed homework")
@@ -111,6 +111,19 @@ class HomeworkTests(APITestCase):
         homework.refresh_from_db()
         self.assertEqual(homework.text, "Updated text")
 
+    def test_homework_cannot_move_to_another_lecture(self):
+        homework = Homework.objects.create(lecture=self.lecture, text="Pinned")
+        other_course = Course.objects.create(title="Go", description="")
+        other_course.teachers.add(self.teacher)
+        other_lecture = Lecture.objects.create(course=other_course, topic="Lesson 1")
+
+        url = reverse('homeworks-detail', args=[homework.id])
+        response = self.client.patch(url, {"lecture": other_lecture.id}, **self.get_auth_headers(self.teacher_token))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        homework.refresh_from_db()
+        self.assertEqual(homework.lecture_id, self.lecture.id)
+
     def test_delete_homework(self):
         homework = Homework.objects.create(lecture=self.lecture, text="To delete")
 
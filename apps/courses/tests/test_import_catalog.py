@@ -0,0 +1,82 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from apps.courses.models import Course, CourseStats, Lecture, Homework
+from apps.users.models import User
+from apps.users.services.password_service import PasswordService
+
+
+class ImportCatalogTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        User.objects.create_user(username="existing", password="123", role="teacher")
+
+    def write(self, name, content):
+        path = Path(self.tmp.name) / name
+        path.write_text(content)
+        return str(path)
+
+    def test_import_users_and_json_catalog(self):
+        users = self.write("users.csv", "username,email,password,role\n"
+                                        "ann,ann@example.com,secret1,teacher\n"
+                                        "bob,,secret2,student\n"
+                                        "existing,,x,teacher\n")
+        catalog = self.write("catalog.json", json.dumps([{
+            "title": "Python",
+            "description": "Learn Python",
+            "teachers": ["ann", "existing"],
+            "students": ["bob"],
+            "lectures": [
+                {"topic": "Intro", "homeworks": ["Install Python", "Hello world"]},
+                {"topic": "Loops", "homeworks": []},
+            ],
+        }]))
+
+        out = StringIO()
+        call_command('import_catalog', users=users, courses=catalog, workers=1, stdout=out)
+
+        self.assertIn("Imported 2 users", out.getvalue())
+        self.assertTrue(check_password("secret1", User.objects.get(username="ann").password))
+
+        course = Course.objects.get(title="Python")
+        self.assertEqual(set(course.teachers.values_list('username', flat=True)), {"ann", "existing"})
+        self.assertEqual(list(course.students.values_list('username', flat=True)), ["bob"])
+        self.assertEqual(Lecture.objects.filter(course=course).count(), 2)
+        self.assertEqual(Homework.objects.filter(lecture__course=course).count(), 2)
+        self.assertEqual(CourseStats.objects.get(course=course).homework_count, 2)
+
+    def test_import_csv_catalog(self):
+        catalog = self.write("catalog.csv", "course,description,lecture,homework\n"
+                                            "Go,Learn Go,Intro,Install Go\n"
+                                            "Go,Learn Go,Intro,Hello world\n"
+                                            "Go,Learn Go,Channels,\n")
+
+        call_command('import_catalog', courses=catalog, stdout=StringIO())
+
+        course = Course.objects.get(title="Go")
+        self.assertEqual(
+            list(Lecture.objects.filter(course=course).order_by('id').values_list('topic', flat=True)),
+            ["Intro", "Channels"],
+        )
+        self.assertEqual(Homework.objects.filter(lecture__course=course).count(), 2)
+
+    def test_missing_required_columns_are_reported(self):
+        users = self.write("users.csv", "email,password,role\nann@example.com,secret1,teacher\n")
+        with self.assertRaisesMessage(CommandError, "missing required column username"):
+            call_command('import_catalog', users=users, workers=1, stdout=StringIO())
+
+        catalog = self.write("catalog.csv", "course,description,homework\nGo,Learn Go,Install Go\n")
+        with self.assertRaisesMessage(CommandError, "missing required column lecture"):
+            call_command('import_catalog', courses=catalog, stdout=StringIO())
+        self.assertFalse(Course.objects.filter(title="Go").exists())
+
+    def test_parallel_password_hashing(self):
+        hashes = PasswordService.hash_many(["a", "b", "c"], workers=2, chunksize=1)
+        self.assertTrue(all(check_password(raw, hashed) for raw, hashed in zip("abc", hashes)))
@@ -83,7 +83,7 @@ class LectureTests(APITestCase):
         url = reverse('lectures-list')
         response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_get_lecture_detail(self):
         lecture = Lecture.objects.create(course=self.course, topic="Detailed Lecture")
@@ -106,6 +106,23 @@ class LectureTests(APITestCase):
         lecture.refresh_from_db()
         self.assertEqual(lecture.topic, "Updated Topic")
 
+    def test_lecture_cannot_move_to_another_course(self):
+        lecture = Lecture.objects.create(course=self.course, topic="Pinned")
+        other_course = Course.objects.create(title="Go", description="")
+        other_course.teachers.add(self.teacher)
+
+        url = reverse('lectures-detail', args=[lecture.id])
+        response = self.client.patch(url, {"course": other_course.id}, **self.get_auth_headers(self.teacher_token))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        lecture.refresh_from_db()
+        self.assertEqual(lecture.course_id, self.course.id)
+
+        response = self.client.put(
+            url, {"course": self.course.id, "topic": "Renamed"}, **self.get_auth_headers(self.teacher_token)
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_delete_lecture(self):
         lecture = Lecture.objects.create(course=self.course, topic="To Delete")
 
@@ -0,0 +1,321 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from uuid import UUID
+
+from django.core.files import locks
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, PresentationUpload
+from apps.users.models import User
+
+
+class PresentationUploadTests(APITestCase):
+    def setUp(self):
+        self.media_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(
+            MEDIA_ROOT=self.media_root,
+            PRESENTATION_UPLOAD_TEMP_DIR=self.media_root / 'uploads',
+            PRESENTATION_CHUNK_SIZE=4,
+        )
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other", password="123", role="teacher")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.other_token = str(AccessToken.for_user(self.other_teacher))
+
+        course = Course.objects.create(title="Python", description="Learn Python")
+        course.teachers.add(self.teacher)
+        self.lecture = Lecture.objects.create(course=course, topic="Lesson 1")
+        self.content = b"%PDF-1.7 lecture slides " * 10
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def start(self, content=None, token=None):
+        content = self.content if content is None else content
+        return self.client.post(
+            reverse('lectures-presentation-upload', args=[self.lecture.id]),
+            {"filename": "slides.pdf", "size": len(content), "sha256": hashlib.sha256(content).hexdigest()},
+            format='json',
+            **self.get_auth_headers(token or self.teacher_token),
+        )
+
+    def append(self, upload_id, offset, chunk):
+        return self.client.patch(
+            reverse('lectures-presentation-upload-chunk', args=[self.lecture.id, upload_id]),
+            data=chunk,
+            content_type='application/offset+octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset),
+            **self.get_auth_headers(self.teacher_token),
+        )
+
+    def complete(self, upload_id):
+        return self.client.post(
+            reverse('lectures-presentation-upload-complete', args=[self.lecture.id, upload_id]),
+            **self.get_auth_headers(self.teacher_token),
+        )
+
+    def test_chunked_upload_attaches_presentation(self):
+        response = self.start()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        upload_id = response.data["id"]
+
+        for offset in range(0, len(self.content), 100):
+            response = self.append(upload_id, offset, self.content[offset:offset + 100])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["offset"], len(self.content))
+
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.lecture.refresh_from_db()
+        with self.lecture.presentation.open('rb') as file:
+            self.assertEqual(file.read(), self.content)
+        self.assertFalse(PresentationUpload.objects.exists())
+        self.assertEqual(list((self.media_root / 'uploads').iterdir()), [])
+
+    def test_resume_after_offset_conflict(self):
+        upload_id = self.start().data["id"]
+        self.append(upload_id, 0, self.content[:50])
+
+        response = self.append(upload_id, 0, self.content[:50])
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["offset"], 50)
+
+        response = self.client.get(
+            reverse('lectures-presentation-upload-chunk', args=[self.lecture.id, upload_id]),
+            **self.get_auth_headers(self.teacher_token),
+        )
+        self.assertEqual(response.data["offset"], 50)
+
+        self.append(upload_id, 50, self.content[50:])
+        self.assertEqual(self.complete(upload_id).status_code, status.HTTP_200_OK)
+
+    def test_incomplete_and_corrupt_uploads_are_rejected(self):
+        upload_id = self.start().data["id"]
+        self.append(upload_id, 0, self.content[:10])
+        self.assertEqual(self.complete(upload_id).status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.append(upload_id, 10, b"x" * (len(self.content) - 10))
+        response = self.complete(upload_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(PresentationUpload.objects.filter(pk=upload_id).exists())
+        self.lecture.refresh_from_db()
+        self.assertFalse(self.lecture.presentation)
+
+    def test_chunk_past_declared_size_is_rejected(self):
+        upload_id = self.start(content=b"short").data["id"]
+
+        response = self.append(upload_id, 0, b"much longer than declared")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_concurrent_append_is_rejected(self):
+        upload_id = self.start().data["id"]
+
+        with (self.media_root / 'uploads' / f'{upload_id}.part').open('r+b') as part:
+            locks.lock(part, locks.LOCK_EX)
+            response = self.append(upload_id, 0, self.content[:50])
+            locks.unlock(part)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(PresentationUpload.objects.get(pk=upload_id).offset, 0)
+        self.assertEqual(self.append(upload_id, 0, self.content[:50]).status_code, status.HTTP_200_OK)
+
+    def test_gc_expires_abandoned_uploads(self):
+        stale_id = self.start().data["id"]
+        self.append(stale_id, 0, self.content[:50])
+        active_id = self.start().data["id"]
+        uploads = self.media_root / 'uploads'
+        orphan = uploads / 'orphan.part'
+        orphan.write_bytes(b"left behind by a deleted lecture")
+        PresentationUpload.objects.filter(pk=stale_id).update(created_at=timezone.now() - timedelta(days=2))
+        for path in (uploads / f'{stale_id}.part', orphan):
+            os.utime(path, (0, 0))
+
+        out = StringIO()
+        call_command('gc_presentations', stdout=out)
+
+        self.assertIn("2 abandoned uploads (82 bytes)", out.getvalue())
+        self.assertEqual(list(PresentationUpload.objects.values_list('pk', flat=True)), [UUID(active_id)])
+        self.assertEqual(list(uploads.iterdir()), [uploads / f'{active_id}.part'])
+
+    def test_other_teacher_cannot_upload(self):
+        response = self.start(token=self.other_token)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class PresentationDownloadTests(APITestCase):
+    def setUp(self):
+        self.media_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.outsider = User.objects.create_user(username="outsider", password="123", role="student")
+        self.student_token = str(AccessToken.for_user(self.student))
+        self.outsider_token = str(AccessToken.for_user(self.outsider))
+
+        course = Course.objects.create(title="Python", description="Learn Python")
+        course.students.add(self.student)
+        self.lecture = Lecture.objects.create(course=course, topic="Lesson 1")
+        self.content = bytes(range(256)) * 4
+        self.lecture.presentation.save("video.mp4", ContentFile(self.content))
+        self.url = reverse('lectures-presentation', args=[self.lecture.id])
+
+    def get_auth_headers(self, token, **extra):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}', **extra}
+
+    def test_lecture_links_the_protected_download(self):
+        response = self.client.get(
+            reverse('lectures-detail', args=[self.lecture.id]), **self.get_auth_headers(self.student_token)
+        )
+
+        self.assertEqual(response.data['presentation'], f'http://testserver{self.url}')
+        self.assertNotIn('/media/', response.data['presentation'])
+
+    def test_full_download(self):
+        response = self.client.get(self.url, **self.get_auth_headers(self.student_token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Type'], 'video/mp4')
+
+    def test_range_requests(self):
+        headers = self.get_auth_headers(self.student_token, HTTP_RANGE='bytes=100-199')
+        response = self.client.get(self.url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), self.content[100:200])
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(self.content)}')
+        self.assertEqual(response['Content-Length'], '100')
+
+        response = self.client.get(self.url, **self.get_auth_headers(self.student_token, HTTP_RANGE='bytes=-10'))
+        self.assertEqual(b"".join(response.streaming_content), self.content[-10:])
+
+        response = self.client.get(self.url, **self.get_auth_headers(self.student_token, HTTP_RANGE='bytes=1000-'))
+        self.assertEqual(b"".join(response.streaming_content), self.content[1000:])
+
+    def test_unsatisfiable_range(self):
+        headers = self.get_auth_headers(self.student_token, HTTP_RANGE=f'bytes={len(self.content)}-')
+        response = self.client.get(self.url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+    def test_stale_if_range_sends_whole_file(self):
+        headers = self.get_auth_headers(self.student_token, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        response = self.client.get(self.url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(PRESENTATION_SENDFILE='x-accel', PRESENTATION_ACCEL_PREFIX='/protected/')
+    def test_accel_redirect_hands_off_to_front_end(self):
+        response = self.client.get(self.url, **self.get_auth_headers(self.student_token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected/{self.lecture.presentation.name}')
+        self.assertEqual(response.content, b"")
+
+    def test_not_enrolled_is_not_found(self):
+        response = self.client.get(self.url, **self.get_auth_headers(self.outsider_token))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ContentAddressedStorageTests(APITestCase):
+    def setUp(self):
+        self.media_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root, PRESENTATION_UPLOAD_TEMP_DIR=self.media_root / 'uploads')
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.spring = Course.objects.create(title="Python, spring", description="")
+        self.autumn = Course.objects.create(title="Python, autumn", description="")
+        self.spring.teachers.add(self.teacher)
+        self.autumn.teachers.add(self.teacher)
+        self.content = b"the same slide deck every semester"
+
+    def blobs(self):
+        return sorted(path for path in (self.media_root / 'presentations').rglob('*') if path.is_file())
+
+    def test_identical_files_share_one_blob(self):
+        first = Lecture.objects.create(course=self.spring, topic="Intro")
+        second = Lecture.objects.create(course=self.autumn, topic="Intro")
+        first.presentation.save("deck.PDF", ContentFile(self.content))
+        second.presentation.save("renamed.pdf", ContentFile(self.content))
+
+        digest = hashlib.sha256(self.content).hexdigest()
+        self.assertEqual(first.presentation.name, f"presentations/{digest[:2]}/{digest}.pdf")
+        self.assertEqual(first.presentation.name, second.presentation.name)
+        self.assertEqual(Lecture.objects.filter(presentation_sha256=digest).count(), 2)
+        self.assertEqual(len(self.blobs()), 1)
+
+    def test_known_hash_skips_upload(self):
+        Lecture.objects.create(course=self.spring, topic="Intro").presentation.save(
+            "deck.pdf", ContentFile(self.content)
+        )
+        lecture = Lecture.objects.create(course=self.autumn, topic="Intro")
+
+        response = self.client.post(
+            reverse('lectures-presentation-upload', args=[lecture.id]),
+            {"filename": "deck.pdf", "size": len(self.content), "sha256": hashlib.sha256(self.content).hexdigest()},
+            format='json',
+            HTTP_AUTHORIZATION=f'Bearer {self.teacher_token}',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["deduplicated"])
+        self.assertFalse(PresentationUpload.objects.exists())
+        lecture.refresh_from_db()
+        with lecture.presentation.open('rb') as file:
+            self.assertEqual(file.read(), self.content)
+
+    def test_gc_removes_only_unreferenced_blobs(self):
+        kept = Lecture.objects.create(course=self.spring, topic="Kept")
+        dropped = Lecture.objects.create(course=self.autumn, topic="Dropped")
+        kept.presentation.save("kept.pdf", ContentFile(self.content))
+        dropped.presentation.save("dropped.pdf", ContentFile(b"an old deck"))
+        dropped.delete()
+
+        out = StringIO()
+        call_command('gc_presentations', grace=0, stdout=out)
+
+        self.assertIn("Deleted 1 unreferenced blobs", out.getvalue())
+        self.assertEqual(self.blobs(), [self.media_root / kept.presentation.name])
+
+    def test_reused_blob_gets_a_fresh_grace_period(self):
+        lecture = Lecture.objects.create(course=self.spring, topic="Old")
+        lecture.presentation.save("deck.pdf", ContentFile(self.content))
+        blob = self.media_root / lecture.presentation.name
+        lecture.delete()
+        os.utime(blob, (0, 0))
+
+        # The same deck is saved again while nothing references it yet.
+        lecture.presentation.storage.save("presentations/deck.pdf", ContentFile(self.content))
+        call_command('gc_presentations', stdout=StringIO())
+
+        self.assertEqual(self.blobs(), [blob])
@@ -0,0 +1,78 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.courses.services.search_service import SearchService
+from apps.submissions.models import Submission
+from apps.users.models import User
+
+
+class SearchTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.other_student = User.objects.create_user(username="other_student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.student_token = str(AccessToken.for_user(self.student))
+
+        self.course = Course.objects.create(title="Python", description="")
+        self.course.teachers.add(self.teacher)
+        self.course.students.add(self.student, self.other_student)
+        other_course = Course.objects.create(title="Go", description="")
+
+        self.lecture = Lecture.objects.create(course=self.course, topic="Recursion and the call stack")
+        self.homework = Homework.objects.create(lecture=self.lecture, text="Write a recursive factorial")
+        Homework.objects.create(lecture=self.lecture, text="Sort a list with loops")
+        Lecture.objects.create(course=other_course, topic="Recursion in Go")
+
+        self.own = Submission.objects.create(
+            homework=self.homework, student=self.student, answer_text="def fact(n): recursion recursion"
+        )
+        self.others = Submission.objects.create(
+            homework=self.homework, student=self.other_student, answer_text="uses recursion too"
+        )
+
+    def search(self, token, **params):
+        return self.client.get(reverse('search'), params, HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_results_are_scoped_and_ranked(self):
+        response = self.search(self.student_token, q="recursion")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        found = [(item['kind'], item['object_id']) for item in response.data['results']]
+        self.assertCountEqual(found, [('lecture', self.lecture.id), ('submission', self.own.id)])
+        ranks = [item['rank'] for item in response.data['results']]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+
+    def test_teacher_sees_course_submissions(self):
+        response = self.search(self.teacher_token, q="recursion", type="submission")
+
+        found = {item['object_id'] for item in response.data['results']}
+        self.assertEqual(found, {self.own.id, self.others.id})
+        self.assertEqual(response.data['count'], 2)
+
+    def test_prefix_and_edits_update_the_index(self):
+        self.homework.text = "Implement memoization"
+        self.homework.save()
+
+        response = self.search(self.teacher_token, q="memoization", type="homework")
+        self.assertEqual([item['object_id'] for item in response.data['results']], [self.homework.id])
+
+        response = self.search(self.teacher_token, q="factorial")
+        self.assertEqual(response.data['results'], [])
+
+    def test_refresh_indexes_bulk_created_rows(self):
+        lecture, = Lecture.objects.bulk_create([Lecture(course=self.course, topic="Dynamic programming")])
+        self.assertEqual(self.search(self.teacher_token, q="dynamic").data['results'], [])
+
+        SearchService.refresh(Lecture.objects.filter(pk=lecture.pk))
+
+        response = self.search(self.teacher_token, q="dynamic")
+        self.assertEqual([item['object_id'] for item in response.data['results']], [lecture.id])
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.search(self.teacher_token).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.search(self.teacher_token, q="x", type="course")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
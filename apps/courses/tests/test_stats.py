@@ -0,0 +1,102 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, CourseStats, Lecture, Homework
+from apps.submissions.models import Submission, Grade
+from apps.users.models import User
+
+
+class CourseStatsTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.student_token = str(AccessToken.for_user(self.student))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        self.lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+        self.homework = Homework.objects.create(lecture=self.lecture, text="Task 1")
+        self.submissions = [
+            Submission.objects.create(homework=self.homework, student=self.student, answer_text="Answer")
+            for _ in range(3)
+        ]
+        self.grade = Grade.objects.create(submission=self.submissions[0], teacher=self.teacher, grade=5)
+        Grade.objects.create(submission=self.submissions[1], teacher=self.teacher, grade=2)
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def current_stats(self):
+        return CourseStats.objects.get(course=self.course)
+
+    def test_counters_follow_creates(self):
+        stats = self.current_stats()
+        self.assertEqual(stats.lecture_count, 1)
+        self.assertEqual(stats.homework_count, 1)
+        self.assertEqual(stats.submission_count, 3)
+        self.assertEqual(stats.ungraded_submission_count, 1)
+        self.assertEqual(stats.grade_count, 2)
+        self.assertEqual(stats.average_grade, 3.5)
+
+    def test_counters_follow_updates_and_deletes(self):
+        self.grade.grade = 3
+        self.grade.save()
+        self.assertEqual(self.current_stats().average_grade, 2.5)
+
+        self.submissions[0].delete()
+        stats = self.current_stats()
+        self.assertEqual(stats.submission_count, 2)
+        self.assertEqual(stats.ungraded_submission_count, 1)
+        self.assertEqual(stats.grade_count, 1)
+
+        self.lecture.delete()
+        stats = self.current_stats()
+        self.assertEqual(
+            [stats.lecture_count, stats.homework_count, stats.submission_count, stats.ungraded_submission_count,
+             stats.grade_count, stats.grade_total],
+            [0, 0, 0, 0, 0, 0],
+        )
+
+    def test_course_with_content_can_be_deleted(self):
+        self.course.delete()
+        # Foreign keys are deferred until commit, which the test transaction never reaches.
+        connection.check_constraints()
+
+        self.assertFalse(Course.objects.filter(pk=self.course.pk).exists())
+        self.assertFalse(CourseStats.objects.filter(course_id=self.course.pk).exists())
+
+    def test_missing_row_is_rebuilt_on_read(self):
+        CourseStats.objects.all().delete()
+        Lecture.objects.create(course=self.course, topic="Lesson 2")
+        self.assertFalse(CourseStats.objects.filter(course=self.course).exists())
+
+        url = reverse('courses-stats', args=[self.course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['lecture_count'], 2)
+        self.assertEqual(response.data['submission_count'], 3)
+
+    def test_rebuild_command(self):
+        CourseStats.objects.all().delete()
+        call_command('rebuild_course_stats', stdout=StringIO())
+
+        stats = self.current_stats()
+        self.assertEqual(stats.submission_count, 3)
+        self.assertEqual(stats.ungraded_submission_count, 1)
+        self.assertEqual(stats.grade_total, 7)
+
+    def test_stats_endpoint(self):
+        url = reverse('courses-stats', args=[self.course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['homework_count'], 1)
+        self.assertEqual(response.data['average_grade'], 3.5)
+
+        response = self.client.get(url, **self.get_auth_headers(self.student_token))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
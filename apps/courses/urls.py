@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CourseViewSet, LectureViewSet, HomeworkViewSet
+from .async_views import CourseAsyncView, LectureAsyncView, HomeworkAsyncView
+from .views import CourseViewSet, LectureViewSet, HomeworkViewSet, SearchView
 
 router = DefaultRouter()
 router.register(r'courses', CourseViewSet, basename='courses')
@@ -9,4 +10,11 @@ router.register(r'homeworks', HomeworkViewSet, basename='homeworks')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('search/', SearchView.as_view(), name='search'),
+    path('async/courses/', CourseAsyncView.as_view(), name='async-courses-list'),
+    path('async/courses/<int:pk>/', CourseAsyncView.as_view(), name='async-courses-detail'),
+    path('async/lectures/', LectureAsyncView.as_view(), name='async-lectures-list'),
+    path('async/lectures/<int:pk>/', LectureAsyncView.as_view(), name='async-lectures-detail'),
+    path('async/homeworks/', HomeworkAsyncView.as_view(), name='async-homeworks-list'),
+    path('async/homeworks/<int:pk>/', HomeworkAsyncView.as_view(), name='async-homeworks-detail'),
 ]
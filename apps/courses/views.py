@@ -1,29 +1,51 @@
-from rest_framework import viewsets, permissions
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from apps.courses.docs.course_docs import add_student_docs, remove_student_docs, add_teacher_docs, course_create_docs, \
-    course_update_docs, course_destroy_docs
+    course_update_docs, course_destroy_docs, course_students_docs, add_students_docs, remove_students_docs, \
+    course_gradebook_docs, course_stats_docs, course_clone_docs
 from apps.courses.docs.homework_docs import homework_create_docs, homework_update_docs, homework_destroy_docs
-from apps.courses.docs.lectures_docs import lecture_create_docs, lecture_update_docs, lecture_destroy_docs
-from apps.courses.models import Course, Lecture, Homework
+from apps.courses.docs.lectures_docs import lecture_create_docs, lecture_update_docs, lecture_destroy_docs, \
+    presentation_upload_docs, presentation_upload_chunk_docs, presentation_upload_complete_docs, \
+    lecture_presentation_docs
+from apps.courses.mixins import CachedRetrieveMixin, ConditionalGetMixin
+from apps.courses.models import Course, CourseStats, Lecture, Homework, PresentationUpload, SERIALIZED_USER_FIELDS
 from apps.courses.permissions import IsTeacher
-from apps.courses.serializers import CourseSerializer, LectureSerializer, HomeworkSerializer
+from apps.courses.docs.search_docs import search_docs
+from apps.courses.serializers import CourseSerializer, LectureSerializer, HomeworkSerializer, CourseStatsSerializer, \
+    SearchResultSerializer
+from apps.courses.services.access_service import CourseAccessService
 from apps.courses.services.course_service import CourseService
 from apps.courses.services.homework_service import HomeworkService
 from apps.courses.services.lecture_service import LectureService
+from apps.courses.services.presentation_service import PresentationDownloadService, PresentationUploadService
+from apps.courses.services.search_service import SearchService
+from apps.courses.services.stats_service import CourseStatsService
+from apps.submissions.services.gradebook_service import GradebookService
+from apps.users.models import User
+from apps.users.serializers import UserSerializer
+from config.pagination import SearchPagination
 
 
-class CourseViewSet(viewsets.ModelViewSet):
-    queryset = Course.objects.all()
+class CourseViewSet(ConditionalGetMixin, CachedRetrieveMixin, viewsets.ModelViewSet):
+    queryset = Course.objects.with_teacher().with_student_count()
     serializer_class = CourseSerializer
 
+    def get_validator_queryset(self):
+        # Without the student count's GROUP BY over the enrollment table.
+        return self.filter_queryset(Course.objects.all())
+
     def perform_create(self, serializer):
         course = serializer.save()
         course.teachers.add(self.request.user)
+        course.student_count = 0
+        CourseAccessService.invalidate(self.request.user)
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy", "add_student", "add_teacher"]:
+        if self.action in ["create", "update", "partial_update", "destroy", "add_student", "add_teacher", "students",
+                           "add_students", "remove_students", "gradebook", "stats", "clone"]:
             return [IsTeacher()]
         return [permissions.IsAuthenticated()]
 
@@ -41,6 +63,73 @@ class CourseViewSet(viewsets.ModelViewSet):
         data, status_code = CourseService.remove_student(course, request.data.get('student_id'))
         return Response(data, status=status_code)
 
+    @add_students_docs
+    @action(detail=True, methods=['post'], permission_classes=[IsTeacher])
+    def add_students(self, request, pk=None):
+        course = self.get_object()
+        CourseService.check_edit_permissions(course, request.user)
+        student_ids = self._get_student_ids(request)
+        if student_ids is None:
+            return Response({"error": "file must be a UTF-8 encoded CSV"}, status=status.HTTP_400_BAD_REQUEST)
+        data, status_code = CourseService.add_students(course, student_ids)
+        return Response(data, status=status_code)
+
+    @remove_students_docs
+    @action(detail=True, methods=['post'], permission_classes=[IsTeacher])
+    def remove_students(self, request, pk=None):
+        course = self.get_object()
+        CourseService.check_edit_permissions(course, request.user)
+        student_ids = self._get_student_ids(request)
+        if student_ids is None:
+            return Response({"error": "file must be a UTF-8 encoded CSV"}, status=status.HTTP_400_BAD_REQUEST)
+        data, status_code = CourseService.remove_students(course, student_ids)
+        return Response(data, status=status_code)
+
+    @staticmethod
+    def _get_student_ids(request):
+        if 'file' in request.FILES:
+            return CourseService.read_student_ids_csv(request.FILES['file'])
+        if hasattr(request.data, 'getlist'):
+            return request.data.getlist('student_ids')
+        return request.data.get('student_ids')
+
+    @course_students_docs
+    @action(detail=True, methods=['get'], permission_classes=[IsTeacher])
+    def students(self, request, pk=None):
+        course = self.get_object()
+        CourseService.check_roster_permissions(course, request.user)
+        students = User.objects.filter(enrolled_courses=course).only(*SERIALIZED_USER_FIELDS)
+        page = self.paginate_queryset(students)
+        serializer = UserSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @course_gradebook_docs
+    @action(detail=True, methods=['get'], permission_classes=[IsTeacher])
+    def gradebook(self, request, pk=None):
+        course = self.get_object()
+        CourseService.check_gradebook_permissions(course, request.user)
+        return Response(GradebookService.get_gradebook(course))
+
+    @course_stats_docs
+    @action(detail=True, methods=['get'], permission_classes=[IsTeacher])
+    def stats(self, request, pk=None):
+        course = self.get_object()
+        CourseService.check_stats_permissions(course, request.user)
+        stats = CourseStats.objects.filter(course=course).first()
+        if stats is None:
+            CourseStatsService.rebuild(course.pk)
+            stats = CourseStats.objects.get(course=course)
+        return Response(CourseStatsSerializer(stats).data)
+
+    @course_clone_docs
+    @action(detail=True, methods=['post'], permission_classes=[IsTeacher])
+    def clone(self, request, pk=None):
+        course = self.get_object()
+        CourseService.check_edit_permissions(course, request.user)
+        clone = CourseService.clone(course, request.user, request.data.get('title'))
+        serializer = self.get_serializer(self.get_queryset().get(pk=clone.pk))
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     @add_teacher_docs
     @action(detail=True, methods=["post"], permission_classes=[IsTeacher])
     def add_teacher(self, request, pk=None):
@@ -65,12 +154,13 @@ class CourseViewSet(viewsets.ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
-class LectureViewSet(viewsets.ModelViewSet):
+class LectureViewSet(ConditionalGetMixin, CachedRetrieveMixin, viewsets.ModelViewSet):
     queryset = Lecture.objects.all()
     serializer_class = LectureSerializer
 
     def get_permissions(self):
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
+        if self.action in ['create', 'update', 'partial_update', 'destroy', 'presentation_upload',
+                           'presentation_upload_chunk', 'presentation_upload_complete']:
             return [IsTeacher()]
         return [permissions.IsAuthenticated()]
 
@@ -79,6 +169,48 @@ class LectureViewSet(viewsets.ModelViewSet):
         LectureService.check_create_permissions(course, self.request.user)
         serializer.save()
 
+    @lecture_presentation_docs
+    @action(detail=True, methods=['get'])
+    def presentation(self, request, pk=None):
+        lecture = get_object_or_404(Lecture.objects.for_user(request.user), pk=pk)
+        if not lecture.presentation:
+            return Response({"error": "Lecture has no presentation"}, status=status.HTTP_404_NOT_FOUND)
+        return PresentationDownloadService.serve(request, lecture)
+
+    def _get_upload(self, upload_id):
+        lecture = self.get_object()
+        LectureService.check_edit_permissions(lecture, self.request.user)
+        return get_object_or_404(PresentationUpload, pk=upload_id, lecture=lecture)
+
+    @presentation_upload_docs
+    @action(detail=True, methods=['post'], permission_classes=[IsTeacher])
+    def presentation_upload(self, request, pk=None):
+        lecture = self.get_object()
+        LectureService.check_edit_permissions(lecture, request.user)
+        data, status_code = PresentationUploadService.init(lecture, request.user, request.data)
+        return Response(data, status=status_code)
+
+    @presentation_upload_chunk_docs
+    @action(detail=True, methods=['get', 'patch'], permission_classes=[IsTeacher],
+            url_path=r'presentation_upload/(?P<upload_id>[0-9a-f-]+)')
+    def presentation_upload_chunk(self, request, pk=None, upload_id=None):
+        upload = self._get_upload(upload_id)
+        if request.method == 'GET':
+            return Response(PresentationUploadService.serialize(upload))
+
+        # The body is read from the raw stream; request.data is never touched so nothing is buffered.
+        data, status_code = PresentationUploadService.append(
+            upload, request.headers.get('Upload-Offset'), request.stream, request.headers.get('Content-Length')
+        )
+        return Response(data, status=status_code)
+
+    @presentation_upload_complete_docs
+    @action(detail=True, methods=['post'], permission_classes=[IsTeacher],
+            url_path=r'presentation_upload/(?P<upload_id>[0-9a-f-]+)/complete')
+    def presentation_upload_complete(self, request, pk=None, upload_id=None):
+        data, status_code = PresentationUploadService.complete(self._get_upload(upload_id))
+        return Response(data, status=status_code)
+
     @lecture_create_docs
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
@@ -96,8 +228,8 @@ class LectureViewSet(viewsets.ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
-class HomeworkViewSet(viewsets.ModelViewSet):
-    queryset = Homework.objects.all()
+class HomeworkViewSet(ConditionalGetMixin, CachedRetrieveMixin, viewsets.ModelViewSet):
+    queryset = Homework.objects.select_related('lecture')
     serializer_class = HomeworkSerializer
 
     def get_permissions(self):
@@ -125,3 +257,22 @@ class HomeworkViewSet(viewsets.ModelViewSet):
         homework = self.get_object()
         HomeworkService.check_edit_permissions(homework, request.user)
         return super().destroy(request, *args, **kwargs)
+
+
+class SearchView(generics.GenericAPIView):
+    serializer_class = SearchResultSerializer
+    pagination_class = SearchPagination
+    permission_classes = [permissions.IsAuthenticated]
+
+    @search_docs
+    def get(self, request):
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response({"error": "q is required"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            kinds = SearchService.parse_kinds(request.query_params.get('type'))
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        page = self.paginate_queryset(SearchService.search(request.user, text, kinds))
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
@@ -0,0 +1,16 @@
+from asgiref.sync import sync_to_async
+
+from apps.courses.async_views import AsyncReadView
+from apps.courses.services.access_service import CourseAccessService
+from apps.submissions.models import Submission
+from apps.submissions.serializers import SubmissionSerializer
+
+
+class SubmissionAsyncView(AsyncReadView):
+    serializer_class = SubmissionSerializer
+    descending = True
+
+    async def get_queryset(self, user):
+        # for_user() reads the memoized course access sets; load them off the event loop first.
+        await sync_to_async(CourseAccessService.get_access)(user)
+        return Submission.objects.for_user(user).select_related('student')
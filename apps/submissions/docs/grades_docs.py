@@ -1,4 +1,4 @@
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import status
 
 grade_create_docs = extend_schema(
@@ -29,6 +29,36 @@ grade_destroy_docs = extend_schema(
     summary="Удалить оценку",
 )
 
+grade_bulk_docs = extend_schema(
+    tags=["Grades"],
+    summary="Выставить или обновить оценки пакетом",
+    request={
+        "application/json": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "submission": {"type": "integer"},
+                    "grade": {"type": "integer"},
+                    "comment": {"type": "string"},
+                },
+                "required": ["submission", "grade"],
+            },
+        }
+    },
+)
+
+grade_export_docs = extend_schema(
+    tags=["Grades"],
+    summary="Выгрузить оценки (CSV/NDJSON)",
+    parameters=[
+        OpenApiParameter("output", type=str, enum=["csv", "ndjson"], location=OpenApiParameter.QUERY),
+        OpenApiParameter("course", type=int, location=OpenApiParameter.QUERY),
+        OpenApiParameter("since", type=str, location=OpenApiParameter.QUERY),
+        OpenApiParameter("until", type=str, location=OpenApiParameter.QUERY),
+    ],
+)
+
 comment_create_docs = extend_schema(
     tags=["Comments"],
     summary="Добавить комментарий к оценке",
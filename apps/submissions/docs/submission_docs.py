@@ -1,4 +1,4 @@
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import status
 
 submission_create_docs = extend_schema(
@@ -22,3 +22,28 @@ submission_update_docs = extend_schema(
     tags=["Submissions"],
     summary="Обновить решение студента",
 )
+
+submission_inbox_docs = extend_schema(
+    tags=["Submissions"],
+    summary="Непроверенные решения по моим курсам",
+)
+
+submission_similar_docs = extend_schema(
+    tags=["Submissions"],
+    summary="Похожие решения по тому же заданию",
+    description="Оценка сходства по MinHash (Jaccard по триграммам слов), не ниже `threshold`.",
+    parameters=[
+        OpenApiParameter("threshold", float, description="Минимальное сходство от 0 до 1."),
+    ],
+)
+
+submission_export_docs = extend_schema(
+    tags=["Submissions"],
+    summary="Выгрузить решения (CSV/NDJSON)",
+    parameters=[
+        OpenApiParameter("output", type=str, enum=["csv", "ndjson"], location=OpenApiParameter.QUERY),
+        OpenApiParameter("course", type=int, location=OpenApiParameter.QUERY),
+        OpenApiParameter("since", type=str, location=OpenApiParameter.QUERY),
+        OpenApiParameter("until", type=str, location=OpenApiParameter.QUERY),
+    ],
+)
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Subquery
+
+from apps.courses.models import Lecture, Homework
+from apps.courses.services.search_service import SearchService
+from apps.submissions.models import Submission, Grade, GradeComment
+from apps.submissions.services.similarity_service import SimilarityService
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the denormalized course and is_graded columns on submissions, grades and grade comments, "
+        "the search vectors of lectures, homeworks and submissions, and missing similarity fingerprints."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            submissions = Submission.objects.filter(course__isnull=True).update(
+                course_id=Subquery(
+                    Homework.objects.filter(pk=OuterRef('homework_id')).values('lecture__course_id')[:1]
+                )
+            )
+            grades = Grade.objects.filter(course__isnull=True).update(
+                course_id=Subquery(Submission.objects.filter(pk=OuterRef('submission_id')).values('course_id')[:1])
+            )
+            comments = GradeComment.objects.filter(course__isnull=True).update(
+                course_id=Subquery(Grade.objects.filter(pk=OuterRef('grade_id')).values('course_id')[:1])
+            )
+            graded = Submission.objects.update(
+                is_graded=Exists(Grade.objects.filter(submission_id=OuterRef('pk')))
+            )
+            indexed = sum(
+                SearchService.refresh(model.objects.filter(search_vector__isnull=True))
+                for model in (Lecture, Homework, Submission)
+            )
+            fingerprinted = SimilarityService.index_many(Submission.objects.filter(fingerprint__isnull=True))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Backfilled {submissions} submissions, {grades} grades, {comments} comments; "
+            f"refreshed grading state of {graded} submissions; indexed {indexed} rows for search; "
+            f"fingerprinted {fingerprinted} submissions."
+        ))
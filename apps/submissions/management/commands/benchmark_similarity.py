@@ -0,0 +1,95 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission, SubmissionFingerprint, SubmissionBucket
+from apps.submissions.services.similarity_service import SimilarityService
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic answers (with planted near-copies) into throwaway homeworks and compare the LSH "
+        "lookup of the `similar` action against a brute-force scan of every signature. Rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,50000', help="Comma-separated submissions per homework.")
+        parser.add_argument('--queries', type=int, default=20)
+        parser.add_argument('--words', type=int, default=60, help="Words per synthetic answer.")
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        vocabulary = [f'word{i}' for i in range(5000)]
+
+        with transaction.atomic():
+            student = User.objects.create_user(username='benchmark-similarity', role=User.Role.STUDENT)
+            course = Course.objects.create(title='Similarity benchmark')
+            lecture = Lecture.objects.create(course=course, topic='Benchmark')
+
+            self.stdout.write(f"{'submissions':>12} {'index/s':>9} {'lsh ms':>9} {'scan ms':>9} {'candidates':>11}")
+            for size in [int(size) for size in options['sizes'].split(',')]:
+                homework = Homework.objects.create(lecture=lecture, text=f'{size} answers')
+                answers = self.answers(rng, vocabulary, size, options['words'])
+                submissions = Submission.objects.bulk_create(
+                    [Submission(homework=homework, course=course, student=student, answer_text=a) for a in answers],
+                    batch_size=2000,
+                )
+
+                started = time.perf_counter()
+                SimilarityService.index_many(Submission.objects.filter(homework=homework))
+                index_rate = size / (time.perf_counter() - started)
+                with connection.cursor() as cursor:
+                    # Fresh statistics, so the bucket lookup is planned against the new rows.
+                    for model in (SubmissionFingerprint, SubmissionBucket):
+                        cursor.execute(f'ANALYZE {model._meta.db_table}')
+
+                queries = rng.sample(submissions, min(options['queries'], size))
+                lsh, candidates = self.time_lsh(queries)
+                scan = self.time_scan(queries, homework)
+                self.stdout.write(f"{size:>12} {index_rate:>9.0f} {lsh:>9.2f} {scan:>9.2f} {candidates:>11.1f}")
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def answers(rng, vocabulary, size, words):
+        answers = []
+        for i in range(size):
+            if i and i % 50 == 0:
+                # A near-copy of an earlier answer with a few words changed.
+                copy = answers[rng.randrange(i)].split()
+                for position in rng.sample(range(len(copy)), max(1, len(copy) // 20)):
+                    copy[position] = rng.choice(vocabulary)
+                answers.append(' '.join(copy))
+            else:
+                answers.append(' '.join(rng.choices(vocabulary, k=words)))
+        return answers
+
+    @staticmethod
+    def time_lsh(queries):
+        started = time.perf_counter()
+        for submission in queries:
+            SimilarityService.similar(submission)
+        elapsed = (time.perf_counter() - started) * 1000 / len(queries)
+
+        # Rows the bucket overlap hands to the exact comparison, excluding the query itself.
+        examined = 0
+        for submission in queries:
+            buckets = SubmissionBucket.objects.filter(fingerprint_id=submission.pk).values('bucket')
+            examined += SubmissionBucket.objects.filter(bucket__in=buckets).values('fingerprint').distinct().count() - 1
+        return elapsed, examined / len(queries)
+
+    @staticmethod
+    def time_scan(queries, homework):
+        started = time.perf_counter()
+        for submission in queries:
+            signature = SimilarityService.load_signature(
+                SubmissionFingerprint.objects.values_list('signature', flat=True).get(pk=submission.pk)
+            )
+            rows = SubmissionFingerprint.objects.filter(homework=homework).values_list('submission_id', 'signature')
+            for _, other in rows:
+                SimilarityService.estimate(signature, SimilarityService.load_signature(other))
+        return (time.perf_counter() - started) * 1000 / len(queries)
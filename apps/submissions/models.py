@@ -1,8 +1,11 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 
-from apps.courses.models import Homework
+from apps.courses.models import Course, Homework, SearchableMixin
+from apps.courses.services.access_service import CourseAccessService
 from apps.submissions.constants import GRADE_MIN, GRADE_MAX
 from apps.users.models import User
 
@@ -12,11 +15,14 @@ class SubmissionQuerySet(QuerySet):
         if user.is_superuser:
             return self.all()
         if user.role == user.Role.STUDENT:
-            return self.filter(student=user)
+            return self.filter(student_id=user.pk)
         if user.role == user.Role.TEACHER:
-            return self.filter(homework__lecture__course__teachers=user)
+            return self.filter(course_id__in=CourseAccessService.get_access(user).teaching)
         return self.none()
 
+    def ungraded(self):
+        return self.filter(is_graded=False)
+
 
 class SubmissionManager(models.Manager):
     def get_queryset(self):
@@ -25,15 +31,18 @@ class SubmissionManager(models.Manager):
     def for_user(self, user):
         return self.get_queryset().for_user(user)
 
+    def ungraded(self):
+        return self.get_queryset().ungraded()
+
 
 class GradeQuerySet(QuerySet):
     def for_user(self, user):
         if user.is_superuser:
             return self.all()
         if user.role == user.Role.STUDENT:
-            return self.filter(submission__student=user)
+            return self.filter(submission__student_id=user.pk)
         if user.role == user.Role.TEACHER:
-            return self.filter(submission__homework__lecture__course__teachers=user)
+            return self.filter(course_id__in=CourseAccessService.get_access(user).teaching)
         return self.none()
 
 
@@ -50,9 +59,9 @@ class GradeCommentQuerySet(QuerySet):
         if user.is_superuser:
             return self.all()
         if user.role == user.Role.STUDENT:
-            return self.filter(grade__submission__student=user)
+            return self.filter(grade__submission__student_id=user.pk)
         if user.role == user.Role.TEACHER:
-            return self.filter(grade__submission__homework__lecture__course__teachers=user)
+            return self.filter(course_id__in=CourseAccessService.get_access(user).teaching)
         return self.none()
 
 
@@ -64,34 +73,105 @@ class GradeCommentManager(models.Manager):
         return self.get_queryset().for_user(user)
 
 
-class Submission(models.Model):
+class Submission(SearchableMixin, models.Model):
+    SEARCH_FIELD = 'answer_text'
+
     homework = models.ForeignKey(Homework, on_delete=models.CASCADE, related_name='submissions')
     student = models.ForeignKey(User, on_delete=models.CASCADE, related_name='submissions')
     answer_text = models.TextField()
     submitted_at = models.DateTimeField(auto_now_add=True)
+    # Denormalized from homework.lecture.course so role-scoped filters avoid the 4-way join.
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name='submissions', null=True, blank=True, editable=False
+    )
+    # Mirrors the existence of the reverse one-to-one grade; kept in sync by apps.submissions.signals.
+    is_graded = models.BooleanField(default=False, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     objects = SubmissionManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', '-submitted_at'], name='submission_student_recent_idx'),
+            models.Index(fields=['homework', 'student'], name='submission_hw_student_idx'),
+            models.Index(fields=['-submitted_at', '-id'], name='submission_recent_idx'),
+            models.Index(
+                fields=['course', 'submitted_at', 'id'], condition=Q(is_graded=False), name='submission_ungraded_idx'
+            ),
+            GinIndex(fields=['search_vector'], name='submission_search_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._course_homework_id = instance.__dict__.get('homework_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Resolve the course only for new rows or a changed homework, not on every answer edit.
+        if self.course_id is None or self.homework_id != getattr(self, '_course_homework_id', None):
+            self.course_id = Homework.objects.filter(pk=self.homework_id).values_list(
+                'lecture__course_id', flat=True
+            ).first()
+        self.set_search_vector(kwargs)
+        super().save(*args, **kwargs)
+        self._course_homework_id = self.homework_id
+
+
+# MinHash signature of an answer; maintained by apps.submissions.services.similarity_service.
+class SubmissionFingerprint(models.Model):
+    submission = models.OneToOneField(
+        Submission, on_delete=models.CASCADE, primary_key=True, related_name='fingerprint'
+    )
+    homework = models.ForeignKey(Homework, on_delete=models.CASCADE, related_name='fingerprints')
+    signature = models.BinaryField()
+
+    def __str__(self):
+        return f'Fingerprint of submission {self.submission_id}'
+
+
+# One row per LSH band of a fingerprint. Rows sharing a bucket are near-duplicate candidates.
+class SubmissionBucket(models.Model):
+    fingerprint = models.ForeignKey(SubmissionFingerprint, on_delete=models.CASCADE, related_name='buckets')
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        indexes = [models.Index(fields=['bucket'], name='submission_bucket_idx')]
+
 
 class Grade(models.Model):
     submission = models.OneToOneField(Submission, on_delete=models.CASCADE, related_name='grade')
     teacher = models.ForeignKey('users.User', on_delete=models.CASCADE)
     grade = models.IntegerField(validators=[MinValueValidator(GRADE_MIN), MaxValueValidator(GRADE_MAX)])
     comment = models.TextField(blank=True, null=True)
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name='grades', null=True, blank=True, editable=False
+    )
 
     objects = GradeManager()
 
     def __str__(self):
         return f'Grade {self.grade} for {self.submission.student.username}'
 
+    def save(self, *args, **kwargs):
+        self.course_id = self.submission.course_id
+        super().save(*args, **kwargs)
+
 
 class GradeComment(models.Model):
     grade = models.ForeignKey(Grade, on_delete=models.CASCADE, related_name='comments')
     author = models.ForeignKey('users.User', on_delete=models.CASCADE)
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name='grade_comments', null=True, blank=True, editable=False
+    )
 
     objects = GradeCommentManager()
 
     def __str__(self):
         return f'Comment by {self.author.username} on grade {self.grade.id}'
+
+    def save(self, *args, **kwargs):
+        self.course_id = self.grade.course_id
+        super().save(*args, **kwargs)
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from apps.courses.models import Homework
+from apps.submissions.constants import GRADE_MIN, GRADE_MAX
 from apps.submissions.models import Submission, Grade, GradeComment
 from apps.users.serializers import UserSerializer
 
@@ -13,6 +14,12 @@ class SubmissionSerializer(serializers.ModelSerializer):
         model = Submission
         fields = ["id", "homework", "student", "answer_text", "submitted_at"]
 
+    # Оценка и комментарии хранят курс работы, поэтому переносить её можно только внутри курса.
+    def validate_homework(self, value):
+        if self.instance is not None and value.lecture.course_id != self.instance.course_id:
+            raise serializers.ValidationError('A submission cannot be moved to another course')
+        return value
+
 
 class GradeSerializer(serializers.ModelSerializer):
     teacher = UserSerializer(read_only=True)  # текущий юзер = учитель
@@ -28,6 +35,12 @@ class GradeSerializer(serializers.ModelSerializer):
         return value
 
 
+class BulkGradeItemSerializer(serializers.Serializer):
+    submission = serializers.IntegerField()
+    grade = serializers.IntegerField(min_value=GRADE_MIN, max_value=GRADE_MAX)
+    comment = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
 class GradeCommentSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
 
@@ -1,4 +1,5 @@
 from rest_framework.exceptions import PermissionDenied
+from apps.courses.services.access_service import CourseAccessService
 from apps.submissions.models import Grade, GradeComment
 from apps.users.models import User
 
@@ -10,14 +11,13 @@ class GradeCommentService:
 
     @staticmethod
     def check_edit_permissions(grade: Grade, user: User):
-        if not (user.is_superuser or grade.teacher == user):
+        if not (user.is_superuser or grade.teacher_id == user.pk):
             raise PermissionDenied("You cannot modify another teacher's grade.")
 
     @staticmethod
     def check_create_permissions(grade, user):
-        if user.role == user.Role.STUDENT and grade.submission.student != user:
+        if user.role == user.Role.STUDENT and grade.submission.student_id != user.pk:
             raise PermissionDenied("You cannot comment on other students' grades.")
 
-        if user.role == user.Role.TEACHER and not grade.submission.homework.lecture.course.teachers.filter(
-                id=user.id).exists():
+        if user.role == user.Role.TEACHER and not CourseAccessService.teaches(user, grade.course_id):
             raise PermissionDenied("You cannot comment on grades outside your courses.")
\ No newline at end of file
@@ -0,0 +1,98 @@
+import csv
+import json
+from datetime import datetime, time
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+class ExportService:
+    CHUNK_SIZE = 2000
+    CONTENT_TYPES = {
+        'csv': 'text/csv',
+        'ndjson': 'application/x-ndjson',
+    }
+
+    SUBMISSION_COLUMNS = (
+        ('id', 'id'),
+        ('course', 'course_id'),
+        ('homework', 'homework_id'),
+        ('student', 'student_id'),
+        ('submitted_at', 'submitted_at'),
+        ('is_graded', 'is_graded'),
+        ('answer_text', 'answer_text'),
+    )
+    GRADE_COLUMNS = (
+        ('id', 'id'),
+        ('course', 'course_id'),
+        ('submission', 'submission_id'),
+        ('homework', 'submission__homework_id'),
+        ('student', 'submission__student_id'),
+        ('teacher', 'teacher_id'),
+        ('grade', 'grade'),
+        ('comment', 'comment'),
+        ('submitted_at', 'submission__submitted_at'),
+    )
+
+    @staticmethod
+    def filter_queryset(queryset, params, date_field):
+        course = params.get('course')
+        if course:
+            if not course.isdigit():
+                raise ValidationError({'course': 'Must be an integer.'})
+            queryset = queryset.filter(course_id=int(course))
+
+        for param, lookup in (('since', 'gte'), ('until', 'lt')):
+            value = params.get(param)
+            if not value:
+                continue
+            try:
+                moment = parse_datetime(value) or parse_date(value)
+            except ValueError:
+                # Well-formed but impossible, e.g. 2024-02-30.
+                moment = None
+            if moment is None:
+                raise ValidationError({param: 'Must be an ISO 8601 date or datetime.'})
+            if not isinstance(moment, datetime):
+                moment = datetime.combine(moment, time.min)
+            if timezone.is_naive(moment):
+                moment = timezone.make_aware(moment)
+            queryset = queryset.filter(**{f'{date_field}__{lookup}': moment})
+        return queryset
+
+    @staticmethod
+    def stream(queryset, columns, output, filename):
+        if output not in ExportService.CONTENT_TYPES:
+            raise ValidationError({'output': f"Must be one of: {', '.join(ExportService.CONTENT_TYPES)}."})
+
+        headers = [header for header, _ in columns]
+        rows = queryset.order_by('id').values_list(*[field for _, field in columns]).iterator(
+            chunk_size=ExportService.CHUNK_SIZE
+        )
+        if output == 'csv':
+            lines = ExportService._csv_lines(headers, rows)
+        else:
+            lines = ExportService._ndjson_lines(headers, rows)
+
+        response = StreamingHttpResponse(lines, content_type=ExportService.CONTENT_TYPES[output])
+        response['Content-Disposition'] = f'attachment; filename="{filename}.{output}"'
+        return response
+
+    @staticmethod
+    def _csv_lines(headers, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(headers)
+        for row in rows:
+            yield writer.writerow(row)
+
+    @staticmethod
+    def _ndjson_lines(headers, rows):
+        for row in rows:
+            yield json.dumps(dict(zip(headers, row)), default=str) + '\n'
@@ -1,5 +1,10 @@
+from django.db import transaction
 from rest_framework.exceptions import PermissionDenied
-from apps.submissions.models import Grade
+from apps.courses.services.access_service import CourseAccessService
+from apps.courses.services.stats_service import CourseStatsService
+from apps.submissions.models import Grade, Submission
+from apps.submissions.serializers import BulkGradeItemSerializer
+from apps.submissions.services.gradebook_service import GradebookService
 from apps.users.models import User
 
 
@@ -10,10 +15,82 @@ class GradeService:
 
     @staticmethod
     def check_edit_permissions(grade: Grade, user: User):
-        if not (user.is_superuser or grade.teacher == user):
+        if not (user.is_superuser or grade.teacher_id == user.pk):
             raise PermissionDenied("You cannot modify another teacher's grade.")
 
     @staticmethod
     def check_create_permissions(submission, user):
-        if submission.student == user:
-            raise PermissionDenied("You cannot grade your own submission.")
\ No newline at end of file
+        if submission.student_id == user.pk:
+            raise PermissionDenied("You cannot grade your own submission.")
+
+    @staticmethod
+    def bulk_upsert(items, user: User):
+        if not isinstance(items, list) or not items:
+            return {"error": "Expected a non-empty list of grades"}, 400
+
+        results, pending = [], {}
+        for item in items:
+            serializer = BulkGradeItemSerializer(data=item)
+            if not serializer.is_valid():
+                submission_id = item.get("submission") if isinstance(item, dict) else None
+                results.append({"submission": submission_id, "errors": serializer.errors})
+                continue
+            data = serializer.validated_data
+            result = {"submission": data["submission"]}
+            results.append(result)
+            if data["submission"] in pending:
+                result["errors"] = ["Duplicate submission in batch."]
+            else:
+                pending[data["submission"]] = (result, data)
+
+        submissions = {
+            row[0]: row[1:]
+            for row in Submission.objects.filter(id__in=pending).values_list(
+                "id", "student_id", "course_id", "grade__teacher_id"
+            )
+        }
+        grades = []
+        for submission_id, (result, data) in pending.items():
+            submission = submissions.get(submission_id)
+            error = GradeService._bulk_item_error(submission, user)
+            if error:
+                result["errors"] = [error]
+                continue
+            _, course_id, teacher_id = submission
+            grades.append(Grade(
+                submission_id=submission_id,
+                teacher=user,
+                grade=data["grade"],
+                comment=data.get("comment"),
+                course_id=course_id,
+            ))
+            result["status"] = "updated" if teacher_id else "graded"
+
+        with transaction.atomic():
+            Grade.objects.bulk_create(
+                grades,
+                update_conflicts=True,
+                unique_fields=["submission"],
+                update_fields=["grade", "comment", "teacher"],
+            )
+            Submission.objects.filter(id__in=[grade.submission_id for grade in grades]).update(is_graded=True)
+        course_ids = {grade.course_id for grade in grades}
+        GradebookService.invalidate(*course_ids)
+        if course_ids:
+            CourseStatsService.rebuild(*course_ids)
+        return {"results": results}, 200
+
+    @staticmethod
+    def _bulk_item_error(submission, user: User):
+        if submission is None:
+            return "Submission not found."
+        student_id, course_id, teacher_id = submission
+        if student_id == user.pk:
+            return "You cannot grade your own submission."
+        if user.is_superuser:
+            return None
+        if not CourseAccessService.teaches(user, course_id):
+            return "You cannot grade submissions outside your courses."
+        if teacher_id is not None and teacher_id != user.pk:
+            return "You cannot modify another teacher's grade."
+        return None
@@ -0,0 +1,92 @@
+import statistics
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+
+from apps.courses.models import Course, Homework
+from apps.submissions.models import Submission
+
+
+class GradebookService:
+    @staticmethod
+    def cache_key(course_id):
+        return f'gradebook:{course_id}'
+
+    @staticmethod
+    def invalidate(*course_ids):
+        cache.delete_many([GradebookService.cache_key(course_id) for course_id in course_ids])
+
+    @staticmethod
+    def get_gradebook(course: Course):
+        # Enrollment changes touch course.updated_at, so it guards the cached roster.
+        cached = cache.get(GradebookService.cache_key(course.pk))
+        if cached is not None and cached['updated_at'] == course.updated_at:
+            return cached['gradebook']
+
+        gradebook = GradebookService.build_gradebook(course)
+        if settings.GRADEBOOK_CACHE_TIMEOUT:
+            cache.set(
+                GradebookService.cache_key(course.pk),
+                {'updated_at': course.updated_at, 'gradebook': gradebook},
+                timeout=settings.GRADEBOOK_CACHE_TIMEOUT,
+            )
+        return gradebook
+
+    @staticmethod
+    def build_gradebook(course: Course):
+        homeworks = list(
+            Homework.objects.filter(lecture__course=course).order_by('id').values_list('id', 'lecture_id')
+        )
+        students = list(course.students.order_by('id').values_list('id', 'username'))
+
+        # One row per (student, homework): the best grade over all attempts.
+        cells = {}
+        for student_id, homework_id, grade in (
+            Submission.objects.filter(course=course)
+            .values('student_id', 'homework_id')
+            .annotate(best=Max('grade__grade'))
+            .values_list('student_id', 'homework_id', 'best')
+        ):
+            cells[student_id, homework_id] = grade
+
+        student_rows = []
+        for student_id, username in students:
+            row = {hw_id: cells[student_id, hw_id] for hw_id, _ in homeworks if (student_id, hw_id) in cells}
+            student_rows.append({
+                'id': student_id,
+                'username': username,
+                'grades': row,
+                **GradebookService._summary(list(row.values()), len(homeworks)),
+            })
+
+        homework_rows = []
+        for homework_id, lecture_id in homeworks:
+            column = [
+                cells[student_id, homework_id] for student_id, _ in students if (student_id, homework_id) in cells
+            ]
+            homework_rows.append({
+                'id': homework_id,
+                'lecture': lecture_id,
+                **GradebookService._summary(column, len(students)),
+            })
+
+        enrolled = {student_id for student_id, _ in students}
+        return {
+            'course': course.pk,
+            'homeworks': homework_rows,
+            'students': student_rows,
+            **GradebookService._summary(
+                [grade for (student_id, _), grade in cells.items() if student_id in enrolled],
+                len(students) * len(homeworks),
+            ),
+        }
+
+    @staticmethod
+    def _summary(submitted, expected):
+        graded = [grade for grade in submitted if grade is not None]
+        return {
+            'average': round(statistics.fmean(graded), 2) if graded else None,
+            'median': statistics.median(graded) if graded else None,
+            'completion_rate': round(len(submitted) / expected, 4) if expected else None,
+        }
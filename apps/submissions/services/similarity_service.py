@@ -0,0 +1,162 @@
+import hashlib
+import random
+import re
+from array import array
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.submissions.models import Submission, SubmissionFingerprint, SubmissionBucket
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+NUM_PERM = 128
+BANDS, ROWS = 32, 4
+# Fixed seed: stored signatures are only comparable while the permutations never change.
+_rng = random.Random(20240901)
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+WORD_RE = re.compile(r'\w+')
+
+
+# MinHash over word 3-gram shingles estimates the Jaccard similarity of two answers.
+# The signature is split into BANDS bands of ROWS values. Each band is hashed together
+# with the homework id into one bucket, stored as a row of the btree-indexed bucket table.
+# Candidates for a submission are the fingerprints sharing any bucket: an index lookup whose
+# cost depends on the number of near-duplicates, not on how many answers the homework has.
+# With 32x4 bands, pairs at 0.5 similarity collide with probability ~0.87 and at 0.8 ~1.0.
+class SimilarityService:
+    SHINGLE_SIZE = 3
+
+    @staticmethod
+    def shingles(text):
+        words = WORD_RE.findall((text or '').lower())
+        size = SimilarityService.SHINGLE_SIZE
+        if len(words) < size:
+            return {' '.join(words)} if words else set()
+        return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    @staticmethod
+    def signature(text):
+        # None for answers without words: an all-MAX_HASH signature would match every other blank answer.
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'little')
+            for shingle in SimilarityService.shingles(text)
+        ]
+        if not hashes:
+            return None
+        return [
+            min((a * value + b) % MERSENNE_PRIME for value in hashes) & MAX_HASH
+            for a, b in PERMUTATIONS
+        ]
+
+    @staticmethod
+    def buckets(homework_id, signature):
+        buckets = []
+        for band in range(BANDS):
+            rows = signature[band * ROWS:(band + 1) * ROWS]
+            key = f'{homework_id}:{band}:' + ','.join(map(str, rows))
+            buckets.append(int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little', signed=True))
+        return buckets
+
+    @staticmethod
+    def estimate(signature, other):
+        return sum(1 for a, b in zip(signature, other) if a == b) / NUM_PERM
+
+    @staticmethod
+    def build(submission: Submission):
+        signature = SimilarityService.signature(submission.answer_text)
+        if signature is None:
+            return None, []
+        fingerprint = SubmissionFingerprint(
+            submission_id=submission.pk,
+            homework_id=submission.homework_id,
+            signature=array('I', signature).tobytes(),
+        )
+        buckets = [
+            SubmissionBucket(fingerprint_id=submission.pk, bucket=bucket)
+            for bucket in SimilarityService.buckets(submission.homework_id, signature)
+        ]
+        return fingerprint, buckets
+
+    @staticmethod
+    def index(submission: Submission):
+        fingerprint, buckets = SimilarityService.build(submission)
+        if fingerprint is None:
+            SubmissionFingerprint.objects.filter(pk=submission.pk).delete()
+            return None
+        with transaction.atomic():
+            fingerprint.save()
+            SubmissionBucket.objects.filter(fingerprint_id=submission.pk).delete()
+            SubmissionBucket.objects.bulk_create(buckets)
+        return fingerprint
+
+    @staticmethod
+    def index_many(submissions, batch_size=1000):
+        # Written one batch at a time so a backfill over every submission runs in bounded memory.
+        indexed = 0
+        fingerprints, buckets, blank = [], [], []
+        for submission in submissions.iterator(chunk_size=batch_size):
+            fingerprint, fingerprint_buckets = SimilarityService.build(submission)
+            if fingerprint is None:
+                blank.append(submission.pk)
+            else:
+                fingerprints.append(fingerprint)
+                buckets.extend(fingerprint_buckets)
+            if len(fingerprints) + len(blank) >= batch_size:
+                indexed += SimilarityService._write(fingerprints, buckets, blank)
+                fingerprints, buckets, blank = [], [], []
+        if fingerprints or blank:
+            indexed += SimilarityService._write(fingerprints, buckets, blank)
+        return indexed
+
+    @staticmethod
+    def _write(fingerprints, buckets, blank):
+        with transaction.atomic():
+            if blank:
+                SubmissionFingerprint.objects.filter(pk__in=blank).delete()
+            SubmissionFingerprint.objects.bulk_create(
+                fingerprints,
+                update_conflicts=True,
+                unique_fields=['submission'],
+                update_fields=['homework', 'signature'],
+            )
+            SubmissionBucket.objects.filter(fingerprint__in=[fingerprint.pk for fingerprint in fingerprints]).delete()
+            SubmissionBucket.objects.bulk_create(buckets)
+        return len(fingerprints)
+
+    @staticmethod
+    def load_signature(data):
+        signature = array('I')
+        signature.frombytes(bytes(data))
+        return signature
+
+    @staticmethod
+    def similar(submission: Submission, threshold=None, limit=20):
+        threshold = settings.SIMILARITY_THRESHOLD if threshold is None else threshold
+        signature = SimilarityService.signature(submission.answer_text)
+        if signature is None:
+            return []
+        buckets = SimilarityService.buckets(submission.homework_id, signature)
+
+        # The homework filter only guards against 64-bit bucket collisions across homeworks.
+        candidates = SubmissionFingerprint.objects.filter(
+            homework_id=submission.homework_id,
+            pk__in=SubmissionBucket.objects.filter(bucket__in=buckets).values('fingerprint_id'),
+        ).exclude(pk=submission.pk).values_list('submission_id', 'signature')
+
+        matches = []
+        for submission_id, other in candidates:
+            similarity = SimilarityService.estimate(signature, SimilarityService.load_signature(other))
+            if similarity >= threshold:
+                matches.append((similarity, submission_id))
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        matches = matches[:limit]
+
+        students = dict(
+            Submission.objects.filter(pk__in=[submission_id for _, submission_id in matches])
+            .values_list('pk', 'student__username')
+        )
+        return [
+            {"submission": submission_id, "student": students.get(submission_id), "similarity": round(similarity, 3)}
+            for similarity, submission_id in matches
+        ]
@@ -10,7 +10,7 @@ class SubmissionService:
 
     @staticmethod
     def check_edit_permissions(submission: Submission, user: User):
-        if not (user.is_superuser or submission.student == user):
+        if not (user.is_superuser or submission.student_id == user.pk):
             raise PermissionDenied("You cannot edit another student's submission.")
 
     @staticmethod
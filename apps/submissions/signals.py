@@ -0,0 +1,68 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.courses.models import Homework
+from apps.courses.services.stats_service import CourseStatsService
+from apps.submissions.models import Submission, Grade
+from apps.submissions.services.gradebook_service import GradebookService
+from apps.submissions.services.similarity_service import SimilarityService
+
+
+@receiver(post_save, sender=Grade)
+def mark_submission_graded(sender, instance, created, **kwargs):
+    if created:
+        Submission.objects.filter(pk=instance.submission_id).update(is_graded=True)
+
+
+@receiver(post_delete, sender=Grade)
+def mark_submission_ungraded(sender, instance, **kwargs):
+    Submission.objects.filter(pk=instance.submission_id).update(is_graded=False)
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_save, sender=Grade)
+@receiver(post_delete, sender=Submission)
+@receiver(post_delete, sender=Grade)
+def invalidate_gradebook(sender, instance, **kwargs):
+    GradebookService.invalidate(instance.course_id)
+
+
+@receiver(post_save, sender=Homework)
+@receiver(post_delete, sender=Homework)
+def invalidate_homework_gradebook(sender, instance, **kwargs):
+    GradebookService.invalidate(instance.lecture.course_id)
+
+
+@receiver(post_save, sender=Submission)
+def count_created_submission(sender, instance, created, **kwargs):
+    if created:
+        CourseStatsService.increment(instance.course_id, submission_count=1, ungraded_submission_count=1)
+
+
+@receiver(post_save, sender=Submission)
+def index_submission_similarity(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or 'answer_text' in update_fields:
+        SimilarityService.index(instance)
+
+
+@receiver(post_delete, sender=Submission)
+def count_deleted_submission(sender, instance, **kwargs):
+    # A graded submission's grade is cascade-deleted first and already moved it back to ungraded.
+    CourseStatsService.increment(instance.course_id, submission_count=-1, ungraded_submission_count=-1)
+
+
+@receiver(post_save, sender=Grade)
+def count_saved_grade(sender, instance, created, **kwargs):
+    if created:
+        CourseStatsService.increment(
+            instance.course_id, ungraded_submission_count=-1, grade_count=1, grade_total=instance.grade
+        )
+    else:
+        CourseStatsService.rebuild(instance.course_id)
+
+
+@receiver(post_delete, sender=Grade)
+def count_deleted_grade(sender, instance, **kwargs):
+    CourseStatsService.increment(
+        instance.course_id, ungraded_submission_count=1, grade_count=-1, grade_total=-instance.grade
+    )
@@ -0,0 +1,49 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission
+from apps.users.models import User
+
+
+class AsyncSubmissionViewTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+
+        course = Course.objects.create(title="Python", description="Learn Python")
+        course.teachers.add(self.teacher)
+        other_course = Course.objects.create(title="Go", description="Learn Go")
+        homework = Homework.objects.create(lecture=Lecture.objects.create(course=course, topic="L1"), text="T1")
+        other_homework = Homework.objects.create(
+            lecture=Lecture.objects.create(course=other_course, topic="L1"), text="T1"
+        )
+
+        self.first = Submission.objects.create(homework=homework, student=self.student, answer_text="First")
+        self.second = Submission.objects.create(homework=homework, student=self.student, answer_text="Second")
+        self.elsewhere = Submission.objects.create(homework=other_homework, student=self.student, answer_text="Go")
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_list_is_scoped_and_newest_first(self):
+        url = reverse('async-submissions-list')
+        response = self.client.get(url, {'limit': 1}, **self.get_auth_headers(self.teacher_token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual([s['id'] for s in data['results']], [self.second.id])
+        self.assertEqual(data['results'][0]['student']['username'], "student")
+
+        data = self.client.get(data['next'], **self.get_auth_headers(self.teacher_token)).json()
+        self.assertEqual([s['id'] for s in data['results']], [self.first.id])
+        self.assertIsNone(data['next'])
+
+    def test_retrieve_outside_scope_is_not_found(self):
+        url = reverse('async-submissions-detail', args=[self.elsewhere.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
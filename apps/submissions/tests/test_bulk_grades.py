@@ -0,0 +1,88 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, CourseStats, Lecture, Homework
+from apps.submissions.models import Submission, Grade
+from apps.users.models import User
+
+
+class BulkGradeTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other_teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.student_token = str(AccessToken.for_user(self.student))
+
+        course = Course.objects.create(title="Python", description="Learn Python")
+        course.teachers.add(self.teacher)
+        other_course = Course.objects.create(title="Go", description="Learn Go")
+        other_course.teachers.add(self.other_teacher)
+
+        homework = Homework.objects.create(lecture=Lecture.objects.create(course=course, topic="L1"), text="T1")
+        other_homework = Homework.objects.create(
+            lecture=Lecture.objects.create(course=other_course, topic="L1"), text="T1"
+        )
+
+        self.submissions = [
+            Submission.objects.create(homework=homework, student=self.student, answer_text=f"Answer {i}")
+            for i in range(3)
+        ]
+        self.foreign = Submission.objects.create(homework=other_homework, student=self.student, answer_text="Go")
+        Grade.objects.create(submission=self.submissions[2], teacher=self.teacher, grade=2)
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_bulk_grades_with_per_item_errors(self):
+        url = reverse('grades-bulk')
+        data = [
+            {"submission": self.submissions[0].id, "grade": 5, "comment": "Great"},
+            {"submission": self.submissions[1].id, "grade": 9},
+            {"submission": self.submissions[2].id, "grade": 4},
+            {"submission": self.foreign.id, "grade": 3},
+            {"submission": 999, "grade": 3},
+        ]
+        response = self.client.post(url, data, format='json', **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual(results[0]["status"], "graded")
+        self.assertIn("grade", results[1]["errors"])
+        self.assertEqual(results[2]["status"], "updated")
+        self.assertIn("errors", results[3])
+        self.assertIn("errors", results[4])
+
+        self.assertEqual(Grade.objects.get(submission=self.submissions[0]).grade, 5)
+        self.assertEqual(Grade.objects.get(submission=self.submissions[0]).course_id, self.submissions[0].course_id)
+        self.assertEqual(Grade.objects.get(submission=self.submissions[2]).grade, 4)
+        self.assertFalse(Grade.objects.filter(submission=self.foreign).exists())
+        self.assertTrue(Submission.objects.get(pk=self.submissions[0].pk).is_graded)
+        self.assertFalse(Submission.objects.get(pk=self.submissions[1].pk).is_graded)
+        self.assertEqual(CourseStats.objects.get(course_id=self.submissions[0].course_id).ungraded_submission_count, 1)
+
+    def test_duplicate_submission_in_batch(self):
+        url = reverse('grades-bulk')
+        data = [
+            {"submission": self.submissions[0].id, "grade": 5},
+            {"submission": self.submissions[0].id, "grade": 1},
+        ]
+        response = self.client.post(url, data, format='json', **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data["results"][0]["status"], "graded")
+        self.assertIn("errors", response.data["results"][1])
+        self.assertEqual(Grade.objects.get(submission=self.submissions[0]).grade, 5)
+
+    def test_bulk_requires_list(self):
+        url = reverse('grades-bulk')
+        response = self.client.post(url, {"submission": 1}, format='json', **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_student_cannot_bulk_grade(self):
+        url = reverse('grades-bulk')
+        data = [{"submission": self.submissions[0].id, "grade": 5}]
+        response = self.client.post(url, data, format='json', **self.get_auth_headers(self.student_token))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Grade.objects.count(), 1)
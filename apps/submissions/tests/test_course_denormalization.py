@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission, Grade, GradeComment
+from apps.users.models import User
+
+
+class CourseDenormalizationTests(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+        self.homework = Homework.objects.create(lecture=lecture, text="Task 1")
+
+    def test_course_is_set_on_save(self):
+        submission = Submission.objects.create(homework=self.homework, student=self.student, answer_text="Answer")
+        grade = Grade.objects.create(submission=submission, teacher=self.teacher, grade=5)
+        comment = GradeComment.objects.create(grade=grade, author=self.student, text="Thanks")
+
+        self.assertEqual(submission.course_id, self.course.id)
+        self.assertEqual(grade.course_id, self.course.id)
+        self.assertEqual(comment.course_id, self.course.id)
+
+    def test_answer_edit_keeps_course_without_lookup(self):
+        submission = Submission.objects.create(homework=self.homework, student=self.student, answer_text="Answer")
+        submission = Submission.objects.get(pk=submission.pk)
+
+        submission.answer_text = "Edited"
+        with CaptureQueriesContext(connection) as queries:
+            submission.save(update_fields=['answer_text'])
+
+        self.assertEqual(submission.course_id, self.course.id)
+        self.assertFalse(any('"courses_homework"' in query['sql'] for query in queries.captured_queries))
+
+    def test_backfill_command(self):
+        submission = Submission.objects.create(homework=self.homework, student=self.student, answer_text="Answer")
+        grade = Grade.objects.create(submission=submission, teacher=self.teacher, grade=5)
+        comment = GradeComment.objects.create(grade=grade, author=self.student, text="Thanks")
+        Submission.objects.update(course=None, is_graded=False)
+        Grade.objects.update(course=None)
+        GradeComment.objects.update(course=None)
+
+        call_command('backfill_denormalized_fields', stdout=StringIO())
+
+        self.assertEqual(Submission.objects.get(pk=submission.pk).course_id, self.course.id)
+        self.assertTrue(Submission.objects.get(pk=submission.pk).is_graded)
+        self.assertEqual(Grade.objects.get(pk=grade.pk).course_id, self.course.id)
+        self.assertEqual(GradeComment.objects.get(pk=comment.pk).course_id, self.course.id)
+
+    def test_teacher_scoping_uses_course_column(self):
+        Submission.objects.create(homework=self.homework, student=self.student, answer_text="Answer")
+        other_teacher = User.objects.create_user(username="other", password="123", role="teacher")
+
+        self.assertEqual(Submission.objects.for_user(self.teacher).count(), 1)
+        self.assertEqual(Submission.objects.for_user(other_teacher).count(), 0)
+        self.assertNotIn('courses_lecture', str(Submission.objects.for_user(self.teacher).query))
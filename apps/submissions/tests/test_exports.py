@@ -0,0 +1,97 @@
+import csv
+import io
+import json
+import warnings
+from datetime import datetime
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission, Grade
+from apps.users.models import User
+
+
+class ExportTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        other_course = Course.objects.create(title="Go", description="Learn Go")
+        other_course.teachers.add(self.teacher)
+
+        homework = Homework.objects.create(lecture=Lecture.objects.create(course=self.course, topic="L1"), text="T")
+        other_homework = Homework.objects.create(
+            lecture=Lecture.objects.create(course=other_course, topic="L1"), text="T"
+        )
+
+        self.submission = Submission.objects.create(homework=homework, student=self.student, answer_text="a, b")
+        Submission.objects.create(homework=other_homework, student=self.student, answer_text="Go")
+        Grade.objects.create(submission=self.submission, teacher=self.teacher, grade=5, comment="Nice")
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def read(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_submission_csv_export(self):
+        url = reverse('submissions-export')
+        response = self.client.get(url, {'course': self.course.id}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['answer_text'], "a, b")
+
+    def test_grade_ndjson_export(self):
+        url = reverse('grades-export')
+        response = self.client.get(url, {'output': 'ndjson'}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['grade'], 5)
+        self.assertEqual(rows[0]['student'], self.student.id)
+
+    def test_export_date_filter(self):
+        url = reverse('submissions-export')
+        response = self.client.get(url, {'since': '2999-01-01'}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(self.read(response).strip().splitlines()[1:], [])
+
+    def test_export_rejects_invalid_parameters(self):
+        url = reverse('submissions-export')
+        response = self.client.get(url, {'output': 'xml'}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url, {'since': 'yesterday'}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url, {'since': '2024-02-30'}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('since', response.data)
+
+    @override_settings(TIME_ZONE='Europe/Moscow')
+    def test_export_dates_start_at_local_midnight(self):
+        submitted_at = timezone.make_aware(datetime(2024, 3, 1, 0, 30))
+        Submission.objects.filter(pk=self.submission.pk).update(submitted_at=submitted_at)
+        url = reverse('submissions-export')
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            since = self.client.get(
+                url, {'course': self.course.id, 'since': '2024-03-01'}, **self.get_auth_headers(self.teacher_token)
+            )
+            until = self.client.get(
+                url, {'course': self.course.id, 'until': '2024-03-01'}, **self.get_auth_headers(self.teacher_token)
+            )
+            self.assertEqual(len(self.read(since).strip().splitlines()), 2)
+            self.assertEqual(len(self.read(until).strip().splitlines()), 1)
@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission, Grade
+from apps.users.models import User
+
+
+class GradebookTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other_teacher", password="123", role="teacher")
+        self.alice = User.objects.create_user(username="alice", password="123", role="student")
+        self.bob = User.objects.create_user(username="bob", password="123", role="student")
+
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.other_teacher_token = str(AccessToken.for_user(self.other_teacher))
+
+        self.course = Course.objects.create(title="Python", description="Learn Python")
+        self.course.teachers.add(self.teacher)
+        self.course.students.add(self.alice, self.bob)
+
+        lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+        self.hw1 = Homework.objects.create(lecture=lecture, text="Task 1")
+        self.hw2 = Homework.objects.create(lecture=lecture, text="Task 2")
+
+        self.grade(self.alice, self.hw1, 3)
+        self.grade(self.alice, self.hw1, 5)
+        self.grade(self.alice, self.hw2, 4)
+        self.grade(self.bob, self.hw1, 2)
+        Submission.objects.create(homework=self.hw2, student=self.bob, answer_text="Ungraded")
+
+    def grade(self, student, homework, value):
+        submission = Submission.objects.create(homework=homework, student=student, answer_text="Answer")
+        return Grade.objects.create(submission=submission, teacher=self.teacher, grade=value)
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_gradebook_matrix_and_statistics(self):
+        url = reverse('courses-gradebook', args=[self.course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        alice, bob = response.data['students']
+        self.assertEqual(alice['grades'], {self.hw1.id: 5, self.hw2.id: 4})
+        self.assertEqual(alice['average'], 4.5)
+        self.assertEqual(alice['completion_rate'], 1)
+        self.assertEqual(bob['grades'], {self.hw1.id: 2, self.hw2.id: None})
+        self.assertEqual(bob['average'], 2)
+        self.assertEqual(bob['completion_rate'], 1)
+
+        hw1, hw2 = response.data['homeworks']
+        self.assertEqual(hw1['average'], 3.5)
+        self.assertEqual(hw2['median'], 4)
+        self.assertEqual(response.data['median'], 4)
+
+    def test_gradebook_refreshes_when_grades_change(self):
+        url = reverse('courses-gradebook', args=[self.course.id])
+        self.client.get(url, **self.get_auth_headers(self.teacher_token))
+
+        self.grade(self.bob, self.hw2, 5)
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.data['students'][1]['grades'][self.hw2.id], 5)
+
+        self.course.students.remove(self.bob)
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(len(response.data['students']), 1)
+
+    def test_other_teacher_cannot_view_gradebook(self):
+        url = reverse('courses-gradebook', args=[self.course.id])
+        response = self.client.get(url, **self.get_auth_headers(self.other_teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -84,3 +84,18 @@ class GradeTests(APITestCase):
         grade.refresh_from_db()
         self.assertEqual(grade.grade, 5)
         self.assertEqual(grade.comment, "Updated comment")
+
+    def test_submissions_are_paginated_newest_first(self):
+        newer = Submission.objects.create(
+            homework=self.submission.homework,
+            student=self.student,
+            answer_text="Second attempt"
+        )
+
+        url = reverse('submissions-list')
+        response = self.client.get(url, {'page_size': 1}, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['id'] for s in response.data['results']], [newer.id])
+
+        response = self.client.get(response.data['next'], **self.get_auth_headers(self.teacher_token))
+        self.assertEqual([s['id'] for s in response.data['results']], [self.submission.id])
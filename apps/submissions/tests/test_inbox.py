@@ -0,0 +1,57 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission, Grade
+from apps.users.models import User
+
+
+class GradingInboxTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other_teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+
+        self.teacher_token = str(AccessToken.for_user(self.teacher))
+        self.student_token = str(AccessToken.for_user(self.student))
+
+        course = Course.objects.create(title="Python", description="Learn Python")
+        course.teachers.add(self.teacher)
+        other_course = Course.objects.create(title="Go", description="Learn Go")
+        other_course.teachers.add(self.other_teacher)
+
+        homework = Homework.objects.create(lecture=Lecture.objects.create(course=course, topic="L1"), text="T1")
+        other_homework = Homework.objects.create(
+            lecture=Lecture.objects.create(course=other_course, topic="L1"), text="T1"
+        )
+
+        self.first = Submission.objects.create(homework=homework, student=self.student, answer_text="First")
+        self.graded = Submission.objects.create(homework=homework, student=self.student, answer_text="Graded")
+        self.second = Submission.objects.create(homework=homework, student=self.student, answer_text="Second")
+        Submission.objects.create(homework=other_homework, student=self.student, answer_text="Elsewhere")
+        Grade.objects.create(submission=self.graded, teacher=self.teacher, grade=5)
+
+    def get_auth_headers(self, token):
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_inbox_lists_ungraded_submissions_oldest_first(self):
+        url = reverse('submissions-inbox')
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s['id'] for s in response.data['results']], [self.first.id, self.second.id])
+
+    def test_deleting_grade_returns_submission_to_inbox(self):
+        self.graded.grade.delete()
+
+        url = reverse('submissions-inbox')
+        response = self.client.get(url, **self.get_auth_headers(self.teacher_token))
+        self.assertEqual(
+            [s['id'] for s in response.data['results']], [self.first.id, self.graded.id, self.second.id]
+        )
+
+    def test_student_cannot_open_inbox(self):
+        url = reverse('submissions-inbox')
+        response = self.client.get(url, **self.get_auth_headers(self.student_token))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,66 @@
+from unittest import skipUnless
+
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.test import TestCase
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission
+from apps.users.models import User
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are PostgreSQL specific')
+class IndexUsageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        cls.students = User.objects.bulk_create(
+            [User(username=f"student{i}", role="student") for i in range(50)]
+        )
+
+        course = Course.objects.create(title="Python", description="Learn Python")
+        course.teachers.add(cls.teacher)
+        lecture = Lecture.objects.create(course=course, topic="Lesson 1")
+        cls.homeworks = Homework.objects.bulk_create(
+            [Homework(lecture=lecture, text=f"Task {i}") for i in range(10)]
+        )
+        Submission.objects.bulk_create(
+            [
+                Submission(homework=homework, student=student, answer_text="answer")
+                for homework in cls.homeworks
+                for student in cls.students
+            ]
+        )
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+            # Small seeded tables always favour sequential scans; disable them so the
+            # plan shows whether a usable index exists at all.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, table):
+        plan = queryset.explain()
+        self.assertNotIn(f'Seq Scan on {table}', plan)
+        self.assertIn('Index', plan)
+
+    def test_student_submissions_use_index(self):
+        queryset = Submission.objects.filter(student=self.students[0]).order_by('-submitted_at')
+        self.assertUsesIndex(queryset, 'submissions_submission')
+
+    def test_homework_student_lookup_uses_index(self):
+        queryset = Submission.objects.filter(homework=self.homeworks[0], student=self.students[0])
+        self.assertUsesIndex(queryset, 'submissions_submission')
+
+    def test_recent_submissions_use_index(self):
+        queryset = Submission.objects.order_by('-submitted_at', '-id')[:50]
+        self.assertUsesIndex(queryset, 'submissions_submission')
+
+    def test_role_filter_uses_index(self):
+        queryset = User.objects.filter(role=User.Role.TEACHER)
+        self.assertUsesIndex(queryset, 'users_user')
+
+    def test_answer_search_uses_gin_index(self):
+        queryset = Submission.objects.filter(search_vector=SearchQuery('answer', config='simple'))
+        self.assertUsesIndex(queryset, 'submissions_submission')
+        self.assertIn('submission_search_idx', queryset.explain())
@@ -103,6 +103,27 @@ class PermissionTests(APITestCase):
 
         self.assertTrue(response.status_code // 100 == 4)
 
+    def test_submission_moves_only_within_its_course(self):
+        admin = User.objects.create_user(username="admin", password="123", role="admin", is_superuser=True)
+        lecture = Lecture.objects.create(course=self.course, topic="Lesson 1")
+        hw = Homework.objects.create(lecture=lecture, text="Task 1")
+        same_course_hw = Homework.objects.create(lecture=lecture, text="Task 2")
+        other_course = Course.objects.create(title="Go", description="")
+        other_hw = Homework.objects.create(lecture=Lecture.objects.create(course=other_course, topic="L"), text="T")
+        sub = Submission.objects.create(homework=hw, student=self.student, answer_text="My answer")
+        url = reverse("submissions-detail", args=[sub.id])
+        headers = self.get_auth_headers(str(AccessToken.for_user(admin)))
+
+        response = self.client.patch(url, {"homework": other_hw.id}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        sub.refresh_from_db()
+        self.assertEqual(sub.homework_id, hw.id)
+
+        response = self.client.patch(url, {"homework": same_course_hw.id}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sub.refresh_from_db()
+        self.assertEqual((sub.homework_id, sub.course_id), (same_course_hw.id, self.course.id))
+
     def test_unauthenticated_user_cannot_access_protected_endpoints(self):
         endpoints = [
             reverse("courses-list"),
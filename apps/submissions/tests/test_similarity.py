@@ -0,0 +1,112 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course, Lecture, Homework
+from apps.submissions.models import Submission, SubmissionFingerprint, SubmissionBucket
+from apps.submissions.services.similarity_service import SimilarityService
+from apps.users.models import User
+
+ANSWER = (
+    "The function walks the list once and keeps a running maximum. When the current element is larger "
+    "than the maximum it replaces it, so after the loop the variable holds the largest value in the list."
+)
+
+
+class SimilarityTests(APITestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="teacher", password="123", role="teacher")
+        self.other_teacher = User.objects.create_user(username="other_teacher", password="123", role="teacher")
+        self.student = User.objects.create_user(username="student", password="123", role="student")
+        self.copier = User.objects.create_user(username="copier", password="123", role="student")
+        self.honest = User.objects.create_user(username="honest", password="123", role="student")
+
+        self.course = Course.objects.create(title="Python", description="")
+        self.course.teachers.add(self.teacher)
+        self.course.students.add(self.student, self.copier, self.honest)
+        Course.objects.create(title="Go", description="").teachers.add(self.other_teacher)
+
+        lecture = Lecture.objects.create(course=self.course, topic="Loops")
+        self.homework = Homework.objects.create(lecture=lecture, text="Find the maximum")
+        self.other_homework = Homework.objects.create(lecture=lecture, text="Find the minimum")
+
+        self.original = Submission.objects.create(homework=self.homework, student=self.student, answer_text=ANSWER)
+        self.copy = Submission.objects.create(
+            homework=self.homework, student=self.copier, answer_text=ANSWER.replace("running", "current")
+        )
+        self.unrelated = Submission.objects.create(
+            homework=self.homework, student=self.honest,
+            answer_text="I sort the numbers in descending order and return the first one from the sorted copy.",
+        )
+        # The same text for another homework is not a candidate.
+        Submission.objects.create(homework=self.other_homework, student=self.honest, answer_text=ANSWER)
+
+    def get_auth_headers(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(user)}'}
+
+    def similar(self, user, submission, **params):
+        url = reverse('submissions-similar', args=[submission.id])
+        return self.client.get(url, params, **self.get_auth_headers(user))
+
+    def test_near_copy_is_found(self):
+        response = self.similar(self.teacher, self.original)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual([item['submission'] for item in results], [self.copy.id])
+        self.assertEqual(results[0]['student'], "copier")
+        self.assertGreater(results[0]['similarity'], 0.5)
+
+    def test_fingerprints_follow_edits(self):
+        self.assertEqual(SubmissionFingerprint.objects.filter(homework=self.homework).count(), 3)
+
+        self.copy.answer_text = "Completely rewritten answer that iterates with a reduce call instead."
+        self.copy.save()
+
+        response = self.similar(self.teacher, self.original)
+        self.assertEqual(response.data['results'], [])
+
+    def test_index_many_writes_in_batches(self):
+        SubmissionFingerprint.objects.all().delete()
+
+        self.assertEqual(SimilarityService.index_many(Submission.objects.all(), batch_size=3), 4)
+        self.assertEqual(SimilarityService.index_many(Submission.objects.all(), batch_size=3), 4)
+
+        self.assertEqual(SubmissionFingerprint.objects.count(), 4)
+        self.assertEqual(SubmissionBucket.objects.count(), 4 * 32)
+        response = self.similar(self.teacher, self.original)
+        self.assertEqual([item['submission'] for item in response.data['results']], [self.copy.id])
+
+    def test_blank_answers_are_not_matched(self):
+        blank = Submission.objects.create(homework=self.homework, student=self.honest, answer_text="")
+        spaces = Submission.objects.create(homework=self.homework, student=self.copier, answer_text="   ")
+
+        self.assertFalse(SubmissionFingerprint.objects.filter(pk__in=[blank.pk, spaces.pk]).exists())
+        self.assertEqual(self.similar(self.teacher, blank).data['results'], [])
+
+        self.copy.answer_text = " "
+        self.copy.save()
+        self.assertFalse(SubmissionFingerprint.objects.filter(pk=self.copy.pk).exists())
+        self.assertEqual(self.similar(self.teacher, self.original).data['results'], [])
+
+    def test_threshold_parameter(self):
+        response = self.similar(self.teacher, self.original, threshold=1)
+        self.assertEqual(response.data['results'], [])
+
+        response = self.similar(self.teacher, self.original, threshold="high")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_course_teachers_can_compare(self):
+        response = self.similar(self.student, self.original)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.similar(self.other_teacher, self.original)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_signature_estimates_jaccard(self):
+        signature = SimilarityService.signature(ANSWER)
+
+        self.assertEqual(SimilarityService.estimate(signature, SimilarityService.signature(ANSWER.upper())), 1)
+        unrelated = SimilarityService.signature(self.unrelated.answer_text)
+        self.assertLess(SimilarityService.estimate(signature, unrelated), 0.1)
@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from .async_views import SubmissionAsyncView
 from .views import SubmissionViewSet, GradeViewSet, GradeCommentViewSet
 
 router = DefaultRouter()
@@ -9,4 +10,6 @@ router.register(r'comments', GradeCommentViewSet, basename='comments')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('async/submissions/', SubmissionAsyncView.as_view(), name='async-submissions-list'),
+    path('async/submissions/<int:pk>/', SubmissionAsyncView.as_view(), name='async-submissions-detail'),
 ]
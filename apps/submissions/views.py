@@ -1,20 +1,28 @@
-from rest_framework import viewsets, permissions
+from django.conf import settings
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
 
 from apps.courses.permissions import IsOwner, IsStudent, IsTeacher
+from config.pagination import InboxCursorPagination, SubmissionCursorPagination
 from apps.submissions.docs.grades_docs import grade_create_docs, grade_update_docs, grade_destroy_docs, \
-    comment_create_docs
-from apps.submissions.docs.submission_docs import submission_create_docs, submission_update_docs
+    comment_create_docs, grade_bulk_docs, grade_export_docs
+from apps.submissions.docs.submission_docs import submission_create_docs, submission_update_docs, \
+    submission_inbox_docs, submission_export_docs, submission_similar_docs
 from apps.submissions.models import Submission, Grade, GradeComment
 from apps.submissions.serializers import GradeCommentSerializer, SubmissionSerializer, GradeSerializer
 from apps.submissions.services.comment_service import GradeCommentService
+from apps.submissions.services.export_service import ExportService
 from apps.submissions.services.grade_service import GradeService
+from apps.submissions.services.similarity_service import SimilarityService
 from apps.submissions.services.submission_service import SubmissionService
 from apps.users.models import User
 
 
 class SubmissionViewSet(viewsets.ModelViewSet):
     serializer_class = SubmissionSerializer
+    pagination_class = SubmissionCursorPagination
 
     def get_queryset(self):
         return Submission.objects.for_user(self.request.user)
@@ -24,8 +32,36 @@ class SubmissionViewSet(viewsets.ModelViewSet):
             return [IsStudent()]
         elif self.action in ["update", "partial_update", "destroy"]:
             return [IsOwner()]
+        elif self.action in ["inbox", "similar"]:
+            return [IsTeacher()]
         return [permissions.IsAuthenticated()]
 
+    @submission_inbox_docs
+    @action(detail=False, methods=["get"], pagination_class=InboxCursorPagination)
+    def inbox(self, request):
+        submissions = self.get_queryset().ungraded().select_related("student")
+        page = self.paginate_queryset(submissions)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @submission_similar_docs
+    @action(detail=True, methods=["get"])
+    def similar(self, request, pk=None):
+        submission = self.get_object()
+        try:
+            threshold = float(request.query_params.get("threshold", settings.SIMILARITY_THRESHOLD))
+        except ValueError:
+            return Response({"error": "threshold must be a number"}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"results": SimilarityService.similar(submission, threshold)})
+
+    @submission_export_docs
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        submissions = ExportService.filter_queryset(self.get_queryset(), request.query_params, "submitted_at")
+        return ExportService.stream(
+            submissions, ExportService.SUBMISSION_COLUMNS, request.query_params.get("output", "csv"), "submissions"
+        )
+
     @submission_create_docs
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
@@ -48,10 +84,24 @@ class GradeViewSet(viewsets.ModelViewSet):
         return Grade.objects.for_user(self.request.user)
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action in ["create", "update", "partial_update", "destroy", "bulk"]:
             return [IsTeacher()]
         return [permissions.IsAuthenticated()]
 
+    @grade_export_docs
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        grades = ExportService.filter_queryset(self.get_queryset(), request.query_params, "submission__submitted_at")
+        return ExportService.stream(
+            grades, ExportService.GRADE_COLUMNS, request.query_params.get("output", "csv"), "grades"
+        )
+
+    @grade_bulk_docs
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        data, status_code = GradeService.bulk_upsert(request.data, request.user)
+        return Response(data, status=status_code)
+
     @grade_create_docs
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
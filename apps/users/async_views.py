@@ -0,0 +1,48 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+
+from apps.users.models import User
+from apps.users.serializers import UserSerializer
+from apps.users.services.user_service import UserService
+
+
+# Same payloads as RegisterView, but the password is hashed in PasswordService's thread
+# pool, so a registration burst under ASGI does not block the event loop. DRF views are
+# synchronous, hence a plain Django view; apps.users.docs.docs adds it to the schema.
+@method_decorator(csrf_exempt, name='dispatch')
+class RegisterAsyncView(View):
+    http_method_names = ['post']
+    serializer_class = UserSerializer
+
+    async def post(self, request):
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({"detail": "Invalid JSON body"}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.serializer_class(data=data)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        validated = serializer.validated_data
+        try:
+            user = await UserService.acreate_user(
+                username=validated["username"],
+                email=validated.get("email"),
+                password=validated["password"],
+                role=validated.get("role", User.Role.STUDENT),
+            )
+        except ValueError as exc:
+            return JsonResponse({"role": [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+        except IntegrityError:
+            # A concurrent registration took the username after validation passed.
+            message = User._meta.get_field('username').error_messages['unique']
+            return JsonResponse({"username": [str(message)]}, status=status.HTTP_400_BAD_REQUEST)
+        return JsonResponse(self.serializer_class(user).data, status=status.HTTP_201_CREATED)
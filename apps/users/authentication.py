@@ -0,0 +1,92 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.users.models import User
+
+
+class RoleTokenUser(TokenUser):
+    Role = User.Role
+
+    def __init__(self, token, state=None):
+        super().__init__(token)
+        self.state = state
+
+    # simplejwt stores the user id claim as a string; compare like a model pk.
+    @cached_property
+    def id(self):
+        return User._meta.pk.to_python(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def pk(self):
+        return self.id
+
+    @cached_property
+    def role(self):
+        return self.state['role'] if self.state else self.token.get('role')
+
+    @cached_property
+    def is_superuser(self):
+        return self.state['is_superuser'] if self.state else self.token.get('is_superuser', False)
+
+
+# Read requests only need id, role and is_superuser, which the token carries, so they get a
+# RoleTokenUser instead of a User row. Writes still load the User: serializers assign
+# request.user to foreign keys. Revocation (deactivation, role changes) is picked up from a
+# short-lived per-user cache entry that the users signals clear on save.
+class StatelessJWTAuthentication(JWTAuthentication):
+    STATE_CACHE_KEY = 'auth:user-state:{}'
+
+    def authenticate(self, request):
+        if request.method not in SAFE_METHODS:
+            return super().authenticate(request)
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return self.get_token_user(validated_token), validated_token
+
+    def get_token_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        state = None
+        if settings.JWT_USER_STATE_TIMEOUT or 'role' not in validated_token:
+            state = self.get_user_state(user_id)
+        return RoleTokenUser(validated_token, state)
+
+    @staticmethod
+    def get_user_state(user_id):
+        key = StatelessJWTAuthentication.STATE_CACHE_KEY.format(user_id)
+        state = cache.get(key)
+        if state is None:
+            state = User.objects.filter(pk=user_id).values('is_active', 'role', 'is_superuser').first()
+            if state is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            if settings.JWT_USER_STATE_TIMEOUT:
+                cache.set(key, state, settings.JWT_USER_STATE_TIMEOUT)
+
+        if not state['is_active']:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return state
+
+    @staticmethod
+    def invalidate(user_id):
+        cache.delete(StatelessJWTAuthentication.STATE_CACHE_KEY.format(user_id))
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    target_class = 'apps.users.authentication.StatelessJWTAuthentication'
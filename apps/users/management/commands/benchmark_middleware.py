@@ -0,0 +1,47 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request latency and DB queries of an API GET with the full session/CSRF "
+        "middleware stack against the path-scoped stack from settings.MIDDLEWARE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/v1/courses/')
+        parser.add_argument('--requests', type=int, default=200)
+
+    def handle(self, *args, **options):
+        scoped = list(settings.MIDDLEWARE)
+        index = scoped.index('config.middleware.PathScopedMiddleware')
+        full = scoped[:index] + list(settings.PATH_SCOPED_MIDDLEWARE) + scoped[index + 1:]
+
+        # A throwaway teacher authenticates the requests; the transaction is rolled back.
+        with transaction.atomic():
+            user = User.objects.create_user(username='benchmark-middleware', role=User.Role.TEACHER)
+            token = str(RefreshToken.for_user(user).access_token)
+            for label, middleware in (('full stack', full), ('path-scoped', scoped)):
+                latency, queries = self.measure(middleware, options['path'], token, options['requests'])
+                self.stdout.write(f"{label:<12} {latency * 1000:8.3f} ms/request   {queries:.2f} queries/request")
+            transaction.set_rollback(True)
+
+    def measure(self, middleware, path, token, count):
+        with override_settings(MIDDLEWARE=middleware):
+            client = Client(HTTP_HOST=settings.ALLOWED_HOSTS[0], HTTP_AUTHORIZATION=f'Bearer {token}')
+            client.get(path)
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for _ in range(count):
+                    client.get(path)
+                elapsed = time.perf_counter() - started
+        return elapsed / count, len(queries) / count
@@ -0,0 +1,62 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+from apps.users.hashers import TunedArgon2PasswordHasher, TunedBCryptSHA256PasswordHasher
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password hashing throughput (registrations/sec) for the Django default PBKDF2 hasher, "
+        "the configured hasher and the tuned Argon2/bcrypt hashers, serially and on a thread pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help="Hashes per thread.")
+        parser.add_argument('--threads', type=int, default=settings.PASSWORD_HASHING_THREADS)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        threads = options['threads']
+        cores = os.cpu_count() or 1
+        strategies = [
+            ('default (pbkdf2)', PBKDF2PasswordHasher),
+            (f'configured ({settings.PASSWORD_HASHER})', import_string(settings.PASSWORD_HASHERS[0])),
+            ('argon2 (tuned)', TunedArgon2PasswordHasher),
+            ('bcrypt (tuned)', TunedBCryptSHA256PasswordHasher),
+        ]
+
+        self.stdout.write(f"{iterations} hashes per thread, {threads} threads, {cores} cores")
+        for label, hasher_class in strategies:
+            hasher = hasher_class()
+            if hasher.library:
+                try:
+                    hasher._load_library()
+                except ValueError as exc:
+                    self.stdout.write(f"{label:<24} skipped: {exc}")
+                    continue
+
+            serial = self.measure(hasher, iterations, threads=1)
+            pooled = self.measure(hasher, iterations * threads, threads=threads)
+            self.stdout.write(
+                f"{label:<24} serial {serial:8.1f}/s per core   "
+                f"pooled {pooled:8.1f}/s ({pooled / min(threads, cores):.1f}/s per core)"
+            )
+
+    def measure(self, hasher, count, threads):
+        salts = [hasher.salt() for _ in range(count)]
+        encode = lambda salt: hasher.encode('benchmark-password', salt)  # noqa: E731
+
+        started = time.perf_counter()
+        if threads == 1:
+            for salt in salts:
+                encode(salt)
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(encode, salts))
+        return count / (time.perf_counter() - started)
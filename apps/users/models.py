@@ -36,7 +36,8 @@ class User(AbstractUser):
     role = models.CharField(
         max_length=20,
         choices=Role.choices,
-        default=Role.STUDENT
+        default=Role.STUDENT,
+        db_index=True
     )
     groups = models.ManyToManyField(
         Group,
@@ -0,0 +1,44 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+
+def _init_worker(settings_module):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+class PasswordService:
+    _executor = None
+
+    @staticmethod
+    def hash_many(passwords, workers=None, chunksize=64):
+        passwords = list(passwords)
+        if workers == 1 or len(passwords) < chunksize:
+            return [make_password(password) for password in passwords]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),),
+        ) as pool:
+            return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+    @staticmethod
+    def get_executor():
+        # PBKDF2 (OpenSSL), argon2-cffi and bcrypt all release the GIL while hashing,
+        # so a bounded thread pool spreads registrations across cores.
+        if PasswordService._executor is None:
+            PasswordService._executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_THREADS, thread_name_prefix='password-hash'
+            )
+        return PasswordService._executor
+
+    @staticmethod
+    async def ahash(password):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(PasswordService.get_executor(), make_password, password)
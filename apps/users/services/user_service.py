@@ -1,4 +1,8 @@
+from asgiref.sync import sync_to_async
+from django.db import transaction
+
 from apps.users.models import User
+from apps.users.services.password_service import PasswordService
 
 
 class UserService:
@@ -14,3 +18,24 @@ class UserService:
             role=role
         )
         return user
+
+    @staticmethod
+    async def acreate_user(username: str, email: str, password: str, role: str) -> User:
+        if role not in [User.Role.STUDENT, User.Role.TEACHER]:
+            raise ValueError("Invalid role. Must be 'student' or 'teacher'.")
+
+        user = User(
+            username=username,
+            email=User.objects.normalize_email(email),
+            role=role,
+            password=await PasswordService.ahash(password),
+        )
+        await sync_to_async(UserService._insert)(user)
+        return user
+
+    @staticmethod
+    def _insert(user: User):
+        # Its own (sub)transaction: a unique violation from a concurrent registration
+        # must not leave an enclosing transaction unusable.
+        with transaction.atomic():
+            user.save(force_insert=True)
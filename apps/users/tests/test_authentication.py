@@ -0,0 +1,92 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.courses.models import Course
+from apps.users.authentication import RoleTokenUser, StatelessJWTAuthentication
+from apps.users.models import User
+from apps.users.serializers import RoleTokenObtainPairSerializer
+
+
+class StatelessJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.teacher = User.objects.create_user(username="teacher", password="pass", role="teacher")
+        self.token = RoleTokenObtainPairSerializer.get_token(self.teacher).access_token
+
+    def authenticate(self, method="get", token=None):
+        request = getattr(self.factory, method)("/", HTTP_AUTHORIZATION=f"Bearer {token or self.token}")
+        return StatelessJWTAuthentication().authenticate(request)
+
+    def test_token_carries_role_claims(self):
+        self.assertEqual(self.token["role"], "teacher")
+        self.assertFalse(self.token["is_superuser"])
+
+    def test_obtain_pair_view_issues_role_claims(self):
+        response = self.client.post(
+            reverse('token_obtain_pair'), {"username": "teacher", "password": "pass"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(AccessToken(response.data["access"])["role"], "teacher")
+
+    @override_settings(JWT_USER_STATE_TIMEOUT=0)
+    def test_read_request_skips_user_lookup(self):
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate()
+
+        self.assertIsInstance(user, RoleTokenUser)
+        self.assertEqual(user.pk, self.teacher.pk)
+        self.assertEqual(user.role, user.Role.TEACHER)
+        self.assertTrue(user.is_authenticated)
+
+    def test_user_state_is_cached(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate()
+
+        self.assertEqual(user.role, "teacher")
+
+    def test_token_without_claims_falls_back_to_database(self):
+        user, _ = self.authenticate(token=AccessToken.for_user(self.teacher))
+
+        self.assertEqual(user.role, "teacher")
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate()
+        self.teacher.is_active = False
+        self.teacher.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_role_change_overrides_claims(self):
+        self.teacher.role = User.Role.STUDENT
+        self.teacher.save()
+
+        user, _ = self.authenticate()
+
+        self.assertEqual(user.role, "student")
+
+    def test_write_request_loads_user(self):
+        user, _ = self.authenticate(method="post")
+
+        self.assertIsInstance(user, User)
+
+    def test_views_accept_token_user(self):
+        course = Course.objects.create(title="Math", description="Algebra")
+        course.teachers.add(self.teacher)
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.token}"}
+
+        response = self.client.get(reverse('courses-stats', args=[course.id]), **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('users-me'), **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["username"], "teacher")
@@ -0,0 +1,38 @@
+from django.test import Client
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.models import User
+
+
+class PathScopedMiddlewareTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="ivan", password="pass123", role="student")
+
+    def test_api_request_skips_session_middleware(self):
+        response = self.client.get(
+            reverse('users-me'), HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(hasattr(response.wsgi_request, 'session'))
+        self.assertNotIn('Cookie', response.get('Vary', ''))
+
+    def test_admin_keeps_sessions_and_csrf(self):
+        client = Client(enforce_csrf_checks=True)
+        response = client.get(reverse('admin:login'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('csrftoken', response.cookies)
+
+        response = client.post(reverse('admin:login'), {"username": "ivan", "password": "pass123"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_session_login_under_api_auth(self):
+        self.assertTrue(self.client.login(username="ivan", password="pass123"))
+        response = self.client.get('/api/auth/login/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.wsgi_request.user, self.user)
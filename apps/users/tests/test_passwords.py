@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.validators import UniqueValidator
+
+from apps.users.models import User
+from apps.users.services.password_service import PasswordService
+
+
+class PasswordHashingTests(APITestCase):
+    def test_async_registration(self):
+        url = reverse('register-async')
+        data = {
+            "username": "ivan",
+            "email": "ivan@example.com",
+            "password": "qwerty123",
+            "role": "student"
+        }
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["role"], "student")
+        self.assertNotIn("password", response.json())
+        self.assertTrue(User.objects.get(username="ivan").check_password("qwerty123"))
+
+    def test_async_registration_validates(self):
+        User.objects.create_user(username="ivan", password="pass123", role="student")
+        url = reverse('register-async')
+        response = self.client.post(url, {"username": "ivan", "password": "x"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("username", response.json())
+
+    def test_async_registration_race_returns_400(self):
+        User.objects.create_user(username="ivan", password="pass123", role="student")
+        url = reverse('register-async')
+
+        # Both requests passed validation; the second insert hits the unique constraint.
+        with mock.patch.object(UniqueValidator, '__call__', return_value=None):
+            response = self.client.post(url, {"username": "ivan", "password": "qwerty123"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("username", response.json())
+        self.assertEqual(User.objects.filter(username="ivan").count(), 1)
+
+    def test_unknown_hasher_setting_is_rejected(self):
+        env = {**os.environ, 'DJANGO_PASSWORD_HASHER': 'md5'}
+        result = subprocess.run(
+            [sys.executable, '-c', 'import config.settings'], env=env, capture_output=True, text=True
+        )
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("ImproperlyConfigured", result.stderr)
+        self.assertIn("pbkdf2, argon2, bcrypt", result.stderr)
+
+    def test_ahash_uses_configured_hasher(self):
+        encoded = async_to_sync(PasswordService.ahash)("qwerty123")
+
+        self.assertEqual(identify_hasher(encoded).algorithm, get_hasher().algorithm)
+        self.assertTrue(check_password("qwerty123", encoded))
+
+    @override_settings(PASSWORD_HASHERS=[
+        'apps.users.hashers.TunedArgon2PasswordHasher',
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ])
+    def test_legacy_hash_upgraded_on_login(self):
+        user = User(username="legacy", role="student")
+        user.password = get_hasher('md5').encode("pass123", get_hasher('md5').salt())
+        user.save()
+
+        self.assertTrue(user.check_password("pass123"))
+        user.refresh_from_db()
+        self.assertEqual(identify_hasher(user.password).algorithm, 'argon2')
@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
+from .async_views import RegisterAsyncView
 from .views import UserViewSet, RegisterView, LoginView, LogoutView
 
 router = DefaultRouter()
@@ -9,6 +10,7 @@ router.register(r'users', UserViewSet, basename='users')
 urlpatterns = [
     path('', include(router.urls)),
     path('register/', RegisterView.as_view(), name='register'),
+    path('register/async/', RegisterAsyncView.as_view(), name='register-async'),
    # path('login/', LoginView.as_view(), name='login'),
    # path('logout/', LogoutView.as_view(), name='logout'),
 
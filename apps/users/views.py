@@ -48,7 +48,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     @me_docs
     @action(detail=False, methods=["get"])
     def me(self, request):
-        serializer = self.get_serializer(request.user)
+        serializer = self.get_serializer(User.objects.get(pk=request.user.pk))
         return Response(serializer.data)
 
 
@@ -0,0 +1,55 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class PathScopedMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    # Runs PATH_SCOPED_MIDDLEWARE (sessions, CSRF, auth, messages) only for requests under
+    # PATH_SCOPED_MIDDLEWARE_PATHS. The JWT-authenticated API never touches those, so the
+    # rest of the traffic goes straight to the next middleware.
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefixes = tuple(settings.PATH_SCOPED_MIDDLEWARE_PATHS)
+        self.view_hooks = []
+
+        handler = get_response
+        for path in reversed(settings.PATH_SCOPED_MIDDLEWARE):
+            middleware = import_string(path)(handler)
+            if hasattr(middleware, 'process_view'):
+                self.view_hooks.insert(0, middleware.process_view)
+            handler = middleware
+        self.scoped_handler = handler
+
+        # Stay async under ASGI so async views are not pushed onto a thread.
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def is_scoped(self, request):
+        return request.path_info.startswith(self.prefixes)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if self.is_scoped(request):
+            return self.scoped_handler(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if self.is_scoped(request):
+            return await self.scoped_handler(request)
+        return await self.get_response(request)
+
+    # The handler only calls process_view on top-level middleware, so forward it
+    # (CsrfViewMiddleware does its checking there).
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not self.is_scoped(request):
+            return None
+        for hook in self.view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
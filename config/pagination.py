@@ -0,0 +1,24 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    ordering = 'id'
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
+
+
+class SubmissionCursorPagination(DefaultCursorPagination):
+    ordering = ('-submitted_at', '-id')
+
+
+class InboxCursorPagination(DefaultCursorPagination):
+    ordering = ('submitted_at', 'id')
+
+
+# Ranked results have no stable column to put a cursor on, so search pages by number.
+class SearchPagination(PageNumberPagination):
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
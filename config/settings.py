@@ -13,6 +13,7 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'apps.courses',
     'apps.submissions',
     'apps.users',
@@ -52,13 +54,23 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'config.middleware.PathScopedMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+# Session-based middleware, run by PathScopedMiddleware only under these prefixes;
+# everything else authenticates with JWT.
+PATH_SCOPED_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
+PATH_SCOPED_MIDDLEWARE_PATHS = ['/admin/', '/api/auth/']
+
+# The admin checks look for these middleware in MIDDLEWARE; they run for /admin/ via PathScopedMiddleware.
+SILENCED_SYSTEM_CHECKS = ['admin.E408', 'admin.E409', 'admin.E410']
 
 CSRF_TRUSTED_ORIGINS = [
     'http://localhost:8000',
@@ -105,18 +117,27 @@ AUTH_USER_MODEL = "users.User"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.StatelessJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'config.pagination.DefaultCursorPagination',
 }
 
+API_PAGE_SIZE = int(os.getenv('API_PAGE_SIZE', '50'))
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '500'))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=int(os.getenv("JWT_ACCESS_MINUTES", "30"))),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=int(os.getenv("JWT_REFRESH_DAYS", "7"))),
+    "TOKEN_OBTAIN_SERIALIZER": "apps.users.serializers.RoleTokenObtainPairSerializer",
 }
 
+# How long read requests trust a cached is_active/role/is_superuser for a token's user.
+# 0 trusts the token claims alone until the token expires.
+JWT_USER_STATE_TIMEOUT = int(os.getenv('JWT_USER_STATE_TIMEOUT', '60'))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Online Course Management API",
     "DESCRIPTION": (
@@ -136,8 +157,62 @@ SPECTACULAR_SETTINGS = {
             }
         }
     },
+    "POSTPROCESSING_HOOKS": [
+        "drf_spectacular.hooks.postprocess_schema_enums",
+        "apps.users.docs.docs.document_async_register",
+    ],
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+    } if os.getenv('REDIS_URL') else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+CONTENT_CACHE_TIMEOUT = int(os.getenv('CONTENT_CACHE_TIMEOUT', '300'))
+# Bump when a cached serializer's output format changes.
+CONTENT_CACHE_VERSION = 2
+# Set to 0 to always compute gradebooks from the database.
+GRADEBOOK_CACHE_TIMEOUT = int(os.getenv('GRADEBOOK_CACHE_TIMEOUT', '3600'))
+
+# Text search configuration used for the search_vector columns and queries. 'simple' does
+# no stemming, which suits mixed-language content; set e.g. 'russian' or 'english' to stem.
+SEARCH_CONFIG = os.getenv('SEARCH_CONFIG', 'simple')
+
+# Near-duplicate detection: submissions whose estimated Jaccard similarity of word
+# 3-gram shingles reaches this value are reported by the `similar` action.
+SIMILARITY_THRESHOLD = float(os.getenv('SIMILARITY_THRESHOLD', '0.5'))
+
+# Password hashing
+# DJANGO_PASSWORD_HASHER picks the hasher for new passwords; the others stay
+# registered so existing hashes keep verifying and are upgraded on login.
+
+_PASSWORD_HASHER_CHOICES = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'argon2': 'apps.users.hashers.TunedArgon2PasswordHasher',
+    'bcrypt': 'apps.users.hashers.TunedBCryptSHA256PasswordHasher',
+}
+PASSWORD_HASHER = os.getenv('DJANGO_PASSWORD_HASHER', 'pbkdf2')
+if PASSWORD_HASHER not in _PASSWORD_HASHER_CHOICES:
+    raise ImproperlyConfigured(
+        f"DJANGO_PASSWORD_HASHER must be one of: {', '.join(_PASSWORD_HASHER_CHOICES)}; got {PASSWORD_HASHER!r}."
+    )
+PASSWORD_HASHERS = [_PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHER_CHOICES.items() if name != PASSWORD_HASHER
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', '2'))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', '65536'))
+# One lane per hash: throughput comes from hashing many passwords in parallel.
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', '1'))
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+
+# Size of the thread pool async views use to hash passwords off the event loop.
+PASSWORD_HASHING_THREADS = int(os.getenv('PASSWORD_HASHING_THREADS', str(os.cpu_count() or 1)))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -174,6 +249,21 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+MEDIA_URL = 'media/'
+MEDIA_ROOT = Path(os.getenv('DJANGO_MEDIA_ROOT', BASE_DIR / 'media'))
+
+# Resumable presentation uploads are assembled here; keep it on the MEDIA_ROOT
+# filesystem so completing an upload is a rename rather than a copy.
+PRESENTATION_UPLOAD_TEMP_DIR = Path(os.getenv('PRESENTATION_UPLOAD_TEMP_DIR', MEDIA_ROOT / 'uploads'))
+PRESENTATION_MAX_SIZE = int(os.getenv('PRESENTATION_MAX_SIZE', str(4 * 1024 ** 3)))
+PRESENTATION_CHUNK_SIZE = 1024 * 1024
+
+# Presentation downloads: 'x-accel' (nginx) or 'x-sendfile' (Apache/lighttpd) hands the
+# transfer to the front-end server after the access check; empty serves from Django.
+# For nginx, map PRESENTATION_ACCEL_PREFIX to MEDIA_ROOT in an `internal` location.
+PRESENTATION_SENDFILE = os.getenv('PRESENTATION_SENDFILE', '')
+PRESENTATION_ACCEL_PREFIX = os.getenv('PRESENTATION_ACCEL_PREFIX', '/protected-media/')
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 